@@ -9,6 +9,11 @@ from app.core.config import settings
 from app.db.base_class import Base
 from app.models.patient import Patient  # Import all models here
 from app.models.user import User  # Import User model
+from app.models.dashboard_counter import DashboardCounter
+from app.models.appointment import Appointment
+from app.models.patient_daily_rollup import PatientDailyRollup
+from app.models.patient_duplicate import PatientDuplicate
+from app.models.clinic import Clinic
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,170 @@
+"""add clinic tenancy
+
+Revision ID: add_clinic_tenancy
+Revises: create_patient_duplicates_table
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_clinic_tenancy'
+down_revision = 'create_patient_duplicates_table'
+branch_labels = None
+depends_on = None
+
+# Existing rows all belong to the clinic created here (settings.DEFAULT_TENANT_ID)
+DEFAULT_TENANT_ID = 1
+TENANT_TABLES = ['users', 'patients', 'appointments', 'patient_duplicates']
+# Patient references that gain tenant_id: (table, old constraint, new constraint, column)
+PATIENT_FOREIGN_KEYS = [
+    ('appointments', 'appointments_patient_id_fkey', 'fk_appointments_patient', 'patient_id'),
+    ('patient_duplicates', 'patient_duplicates_patient_id_fkey', 'fk_patient_duplicates_patient', 'patient_id'),
+    ('patient_duplicates', 'patient_duplicates_duplicate_id_fkey', 'fk_patient_duplicates_duplicate', 'duplicate_id'),
+]
+
+def _create_rollups(*key_columns):
+    op.create_table(
+        'patient_daily_rollups',
+        *key_columns,
+        sa.Column('new_patients', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint(*(column.name for column in key_columns))
+    )
+
+def upgrade():
+    bind = op.get_bind()
+    postgres = bind.dialect.name == 'postgresql'
+
+    op.create_table(
+        'clinics',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('slug', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_clinics_id'), 'clinics', ['id'], unique=False)
+    op.create_index(op.f('ix_clinics_slug'), 'clinics', ['slug'], unique=True)
+    op.execute(
+        "INSERT INTO clinics (id, name, slug, created_at) "
+        f"VALUES ({DEFAULT_TENANT_ID}, 'Default clinic', 'default', CURRENT_TIMESTAMP)"
+    )
+    if postgres:
+        op.execute(f"SELECT setval('clinics_id_seq', {DEFAULT_TENANT_ID})")
+
+    for table in TENANT_TABLES:
+        op.add_column(table, sa.Column(
+            'tenant_id', sa.Integer(), nullable=False, server_default=str(DEFAULT_TENANT_ID)
+        ))
+
+    # Indexes lead with tenant_id, since every query is scoped to one clinic
+    op.create_index(op.f('ix_users_tenant_id'), 'users', ['tenant_id'], unique=False)
+    op.drop_index('ix_patients_email', table_name='patients')
+    op.drop_index('ix_patients_last_name_id', table_name='patients')
+    op.drop_index('ix_patients_created_at_id', table_name='patients')
+    op.create_index('ix_patients_tenant_id_id', 'patients', ['tenant_id', 'id'], unique=True)
+    op.create_index('ix_patients_tenant_id_email', 'patients', ['tenant_id', 'email'], unique=True)
+    op.create_index('ix_patients_tenant_id_last_name_id', 'patients', ['tenant_id', 'last_name', 'id'], unique=False)
+    op.create_index('ix_patients_tenant_id_created_at_id', 'patients', ['tenant_id', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_appointments_start_time_status', table_name='appointments')
+    op.create_index('ix_appointments_tenant_id_start_time_status', 'appointments', ['tenant_id', 'start_time', 'status'], unique=False)
+    op.drop_index('ix_patient_duplicates_status_score', table_name='patient_duplicates')
+    op.create_index('ix_patient_duplicates_tenant_id_status_score', 'patient_duplicates', ['tenant_id', 'status', 'score'], unique=False)
+
+    if postgres:
+        # SQLite cannot alter constraints in place, and does not enforce them by default
+        for table in TENANT_TABLES:
+            op.create_foreign_key(f'{table}_tenant_id_fkey', table, 'clinics', ['tenant_id'], ['id'])
+            op.alter_column(table, 'tenant_id', server_default=None)
+        for table, old, new, column in PATIENT_FOREIGN_KEYS:
+            op.drop_constraint(old, table, type_='foreignkey')
+            op.create_foreign_key(
+                new, table, 'patients', ['tenant_id', column], ['tenant_id', 'id'], ondelete='CASCADE'
+            )
+
+    # The rollup gains tenant_id in its primary key; rebuild it from patients
+    op.drop_table('patient_daily_rollups')
+    _create_rollups(
+        sa.Column('tenant_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+    )
+    if postgres:
+        op.create_foreign_key(
+            'patient_daily_rollups_tenant_id_fkey', 'patient_daily_rollups', 'clinics', ['tenant_id'], ['id']
+        )
+    day = "CAST(created_at AS DATE)" if postgres else "date(created_at)"
+    op.execute(
+        "INSERT INTO patient_daily_rollups (tenant_id, day, new_patients, updated_at) "
+        f"SELECT tenant_id, {day}, count(*), CURRENT_TIMESTAMP FROM patients "
+        f"WHERE created_at IS NOT NULL GROUP BY tenant_id, {day}"
+    )
+
+    # Counter keys gain the tenant id: new_patients:2024-03 -> new_patients:1:2024-03
+    op.execute(
+        f"UPDATE dashboard_counters SET key = 'total_patients:{DEFAULT_TENANT_ID}' "
+        "WHERE key = 'total_patients'"
+    )
+    op.execute(
+        f"UPDATE dashboard_counters SET key = 'patients_version:{DEFAULT_TENANT_ID}' "
+        "WHERE key = 'patients_version'"
+    )
+    op.execute(
+        f"UPDATE dashboard_counters SET key = 'new_patients:{DEFAULT_TENANT_ID}:' || substr(key, 14) "
+        "WHERE key LIKE 'new_patients:____-__'"
+    )
+
+def downgrade():
+    bind = op.get_bind()
+    postgres = bind.dialect.name == 'postgresql'
+
+    op.execute("DELETE FROM dashboard_counters WHERE key LIKE 'total_patients:%' "
+               f"AND key <> 'total_patients:{DEFAULT_TENANT_ID}'")
+    op.execute("DELETE FROM dashboard_counters WHERE key LIKE 'patients_version:%' "
+               f"AND key <> 'patients_version:{DEFAULT_TENANT_ID}'")
+    op.execute("DELETE FROM dashboard_counters WHERE key LIKE 'new_patients:%:%' "
+               f"AND key NOT LIKE 'new_patients:{DEFAULT_TENANT_ID}:%'")
+    op.execute(f"UPDATE dashboard_counters SET key = 'total_patients' WHERE key = 'total_patients:{DEFAULT_TENANT_ID}'")
+    op.execute(f"UPDATE dashboard_counters SET key = 'patients_version' WHERE key = 'patients_version:{DEFAULT_TENANT_ID}'")
+    prefix = f"new_patients:{DEFAULT_TENANT_ID}:"
+    op.execute(
+        f"UPDATE dashboard_counters SET key = 'new_patients:' || substr(key, {len(prefix) + 1}) "
+        f"WHERE key LIKE '{prefix}%'"
+    )
+
+    op.drop_table('patient_daily_rollups')
+    _create_rollups(sa.Column('day', sa.Date(), nullable=False))
+    day = "CAST(created_at AS DATE)" if postgres else "date(created_at)"
+    op.execute(
+        "INSERT INTO patient_daily_rollups (day, new_patients, updated_at) "
+        f"SELECT {day}, count(*), CURRENT_TIMESTAMP FROM patients "
+        f"WHERE created_at IS NOT NULL GROUP BY {day}"
+    )
+
+    if postgres:
+        for table, old, new, column in PATIENT_FOREIGN_KEYS:
+            op.drop_constraint(new, table, type_='foreignkey')
+            op.create_foreign_key(old, table, 'patients', [column], ['id'], ondelete='CASCADE')
+        for table in TENANT_TABLES:
+            op.drop_constraint(f'{table}_tenant_id_fkey', table, type_='foreignkey')
+
+    op.drop_index('ix_patient_duplicates_tenant_id_status_score', table_name='patient_duplicates')
+    op.create_index('ix_patient_duplicates_status_score', 'patient_duplicates', ['status', 'score'], unique=False)
+    op.drop_index('ix_appointments_tenant_id_start_time_status', table_name='appointments')
+    op.create_index('ix_appointments_start_time_status', 'appointments', ['start_time', 'status'], unique=False)
+    op.drop_index('ix_patients_tenant_id_created_at_id', table_name='patients')
+    op.drop_index('ix_patients_tenant_id_last_name_id', table_name='patients')
+    op.drop_index('ix_patients_tenant_id_email', table_name='patients')
+    op.drop_index('ix_patients_tenant_id_id', table_name='patients')
+    op.create_index('ix_patients_created_at_id', 'patients', ['created_at', 'id'], unique=False)
+    op.create_index('ix_patients_last_name_id', 'patients', ['last_name', 'id'], unique=False)
+    # Fails if two clinics share a patient email, which is only allowed from here on
+    op.create_index(op.f('ix_patients_email'), 'patients', ['email'], unique=True)
+    op.drop_index(op.f('ix_users_tenant_id'), table_name='users')
+    for table in TENANT_TABLES:
+        op.drop_column(table, 'tenant_id')
+
+    op.drop_index(op.f('ix_clinics_slug'), table_name='clinics')
+    op.drop_index(op.f('ix_clinics_id'), table_name='clinics')
+    op.drop_table('clinics')
@@ -0,0 +1,30 @@
+"""add patient keyset pagination indexes
+
+Revision ID: add_patient_keyset_indexes
+Revises: update_patients_schema
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_patient_keyset_indexes'
+down_revision = 'update_patients_schema'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Keyset pages compare (created_at, id) row values, which skip NULLs,
+    # so every patient needs a creation time
+    op.execute("UPDATE patients SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+    with op.batch_alter_table('patients') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+    op.create_index('ix_patients_last_name_id', 'patients', ['last_name', 'id'], unique=False)
+    op.create_index('ix_patients_created_at_id', 'patients', ['created_at', 'id'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_patients_created_at_id', table_name='patients')
+    op.drop_index('ix_patients_last_name_id', table_name='patients')
+    with op.batch_alter_table('patients') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True), nullable=True)
@@ -0,0 +1,70 @@
+"""add patient search indexes
+
+Revision ID: add_patient_search_indexes
+Revises: add_patient_keyset_indexes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_patient_search_indexes'
+down_revision = 'add_patient_keyset_indexes'
+branch_labels = None
+depends_on = None
+
+# Keep these expressions identical to SEARCH_DOCUMENT / PHONE_DIGITS in app/crud/patient.py
+SEARCH_DOCUMENT = (
+    "to_tsvector('simple', coalesce(first_name, '') || ' ' || "
+    "coalesce(last_name, '') || ' ' || coalesce(email, ''))"
+)
+PHONE_DIGITS = "regexp_replace(coalesce(phone, ''), '\\D', '', 'g')"
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(f"CREATE INDEX ix_patients_search_document ON patients USING gin ({SEARCH_DOCUMENT})")
+        op.execute("CREATE INDEX ix_patients_first_name_trgm ON patients USING gin (lower(first_name) gin_trgm_ops)")
+        op.execute("CREATE INDEX ix_patients_last_name_trgm ON patients USING gin (lower(last_name) gin_trgm_ops)")
+        op.execute("CREATE INDEX ix_patients_email_trgm ON patients USING gin (lower(email) gin_trgm_ops)")
+        op.execute(f"CREATE INDEX ix_patients_phone_digits_trgm ON patients USING gin (({PHONE_DIGITS}) gin_trgm_ops)")
+    elif bind.dialect.name == 'sqlite':
+        # External-content FTS5 table kept in sync with patients by triggers
+        op.execute(
+            "CREATE VIRTUAL TABLE patients_fts USING fts5("
+            "first_name, last_name, email, phone, "
+            "content='patients', content_rowid='id', prefix='2 3')"
+        )
+        op.execute(
+            "CREATE TRIGGER patients_fts_ai AFTER INSERT ON patients BEGIN "
+            "INSERT INTO patients_fts(rowid, first_name, last_name, email, phone) "
+            "VALUES (new.id, new.first_name, new.last_name, new.email, new.phone); END"
+        )
+        op.execute(
+            "CREATE TRIGGER patients_fts_ad AFTER DELETE ON patients BEGIN "
+            "INSERT INTO patients_fts(patients_fts, rowid, first_name, last_name, email, phone) "
+            "VALUES ('delete', old.id, old.first_name, old.last_name, old.email, old.phone); END"
+        )
+        op.execute(
+            "CREATE TRIGGER patients_fts_au AFTER UPDATE ON patients BEGIN "
+            "INSERT INTO patients_fts(patients_fts, rowid, first_name, last_name, email, phone) "
+            "VALUES ('delete', old.id, old.first_name, old.last_name, old.email, old.phone); "
+            "INSERT INTO patients_fts(rowid, first_name, last_name, email, phone) "
+            "VALUES (new.id, new.first_name, new.last_name, new.email, new.phone); END"
+        )
+        op.execute("INSERT INTO patients_fts(patients_fts) VALUES ('rebuild')")
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.drop_index('ix_patients_phone_digits_trgm', table_name='patients')
+        op.drop_index('ix_patients_email_trgm', table_name='patients')
+        op.drop_index('ix_patients_last_name_trgm', table_name='patients')
+        op.drop_index('ix_patients_first_name_trgm', table_name='patients')
+        op.drop_index('ix_patients_search_document', table_name='patients')
+    elif bind.dialect.name == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS patients_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS patients_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS patients_fts_ai")
+        op.execute("DROP TABLE IF EXISTS patients_fts")
@@ -0,0 +1,44 @@
+"""create appointments table
+
+Revision ID: create_appointments_table
+Revises: create_dashboard_counters_table
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'create_appointments_table'
+down_revision = 'create_dashboard_counters_table'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'appointments',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('patient_id', sa.Integer(), nullable=False),
+        sa.Column('provider_id', sa.Integer(), nullable=False),
+        sa.Column('start_time', sa.DateTime(), nullable=False),
+        sa.Column('end_time', sa.DateTime(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False, server_default='scheduled'),
+        sa.Column('reason', sa.String(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['patient_id'], ['patients.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['provider_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_appointments_id'), 'appointments', ['id'], unique=False)
+    op.create_index('ix_appointments_provider_id_start_time', 'appointments', ['provider_id', 'start_time'])
+    op.create_index('ix_appointments_patient_id_start_time', 'appointments', ['patient_id', 'start_time'])
+    op.create_index('ix_appointments_start_time_status', 'appointments', ['start_time', 'status'])
+
+def downgrade():
+    op.drop_index('ix_appointments_start_time_status', table_name='appointments')
+    op.drop_index('ix_appointments_patient_id_start_time', table_name='appointments')
+    op.drop_index('ix_appointments_provider_id_start_time', table_name='appointments')
+    op.drop_index(op.f('ix_appointments_id'), table_name='appointments')
+    op.drop_table('appointments')
@@ -0,0 +1,40 @@
+"""create dashboard counters table
+
+Revision ID: create_dashboard_counters_table
+Revises: add_patient_search_indexes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'create_dashboard_counters_table'
+down_revision = 'add_patient_search_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'dashboard_counters',
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('value', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('key')
+    )
+
+    # Seed the counters from the current patients table
+    bind = op.get_bind()
+    month = "to_char(created_at, 'YYYY-MM')" if bind.dialect.name == 'postgresql' else "strftime('%Y-%m', created_at)"
+    op.execute(
+        "INSERT INTO dashboard_counters (key, value, updated_at) "
+        "SELECT 'total_patients', count(*), CURRENT_TIMESTAMP FROM patients"
+    )
+    op.execute(
+        "INSERT INTO dashboard_counters (key, value, updated_at) "
+        f"SELECT 'new_patients:' || {month}, count(*), CURRENT_TIMESTAMP FROM patients "
+        f"WHERE created_at IS NOT NULL GROUP BY {month}"
+    )
+
+def downgrade():
+    op.drop_table('dashboard_counters')
@@ -0,0 +1,36 @@
+"""create patient daily rollups table
+
+Revision ID: create_patient_daily_rollups_table
+Revises: create_appointments_table
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'create_patient_daily_rollups_table'
+down_revision = 'create_appointments_table'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'patient_daily_rollups',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('new_patients', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('day')
+    )
+
+    # Seed the rollup from the current patients table
+    bind = op.get_bind()
+    day = "CAST(created_at AS DATE)" if bind.dialect.name == 'postgresql' else "date(created_at)"
+    op.execute(
+        "INSERT INTO patient_daily_rollups (day, new_patients, updated_at) "
+        f"SELECT {day}, count(*), CURRENT_TIMESTAMP FROM patients "
+        f"WHERE created_at IS NOT NULL GROUP BY {day}"
+    )
+
+def downgrade():
+    op.drop_table('patient_daily_rollups')
@@ -0,0 +1,42 @@
+"""create patient duplicates table
+
+Revision ID: create_patient_duplicates_table
+Revises: create_patient_daily_rollups_table
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'create_patient_duplicates_table'
+down_revision = 'create_patient_daily_rollups_table'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        'patient_duplicates',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('patient_id', sa.Integer(), nullable=False),
+        sa.Column('duplicate_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('reasons', sa.String(), nullable=False, server_default=''),
+        sa.Column('status', sa.String(), nullable=False, server_default='pending'),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['patient_id'], ['patients.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['duplicate_id'], ['patients.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_patient_duplicates_id'), 'patient_duplicates', ['id'], unique=False)
+    op.create_index('ix_patient_duplicates_pair', 'patient_duplicates', ['patient_id', 'duplicate_id'], unique=True)
+    op.create_index('ix_patient_duplicates_status_score', 'patient_duplicates', ['status', 'score'], unique=False)
+    op.create_index('ix_patient_duplicates_duplicate_id', 'patient_duplicates', ['duplicate_id'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_patient_duplicates_duplicate_id', table_name='patient_duplicates')
+    op.drop_index('ix_patient_duplicates_status_score', table_name='patient_duplicates')
+    op.drop_index('ix_patient_duplicates_pair', table_name='patient_duplicates')
+    op.drop_index(op.f('ix_patient_duplicates_id'), table_name='patient_duplicates')
+    op.drop_table('patient_duplicates')
@@ -1,31 +1,27 @@
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
+from typing import AsyncGenerator, Callable, Optional
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
-from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
-from app.models.user import User
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.routing import READ_YOUR_WRITES_COOKIE, SAFE_METHODS, read_your_writes
+from app.db.session import ReplicaSessionLocal, SessionLocal, get_db
 from app.core.config import settings
-from app.schemas.user import TokenData
+from app.core.security import get_principal
+from app.schemas.user import TokenData, User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login", auto_error=False)
 
-def get_db() -> Generator:
-    try:
-        db = SessionLocal()
-        yield db
-    finally:
-        db.close()
-
-async def get_current_user(
-    db: Session = Depends(get_db),
-    token: str = Depends(oauth2_scheme)
-) -> User:
+async def authenticate(db: AsyncSession, token: Optional[str]) -> User:
+    """
+    Resolve a bearer token to its user, raising 401 if it is missing or invalid.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    if not token:
+        raise credentials_exception
     try:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
         email: str = payload.get("sub")
@@ -35,14 +31,47 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == token_data.email).first()
+    user = await get_principal(db, email=token_data.email)
     if user is None:
         raise credentials_exception
     return user
 
+async def get_current_user(
+    db: AsyncSession = Depends(get_db),
+    token: str = Depends(oauth2_scheme)
+) -> User:
+    return await authenticate(db, token)
+
 async def get_current_active_user(
+    request: Request,
     current_user: User = Depends(get_current_user),
 ) -> User:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user 
\ No newline at end of file
+    if request.method not in SAFE_METHODS:
+        read_your_writes.mark(current_user.email)
+    return current_user
+
+def get_current_tenant(current_user: User = Depends(get_current_active_user)) -> int:
+    """
+    The clinic the current user belongs to; every patient-data query is scoped to it.
+    """
+    return current_user.tenant_id
+
+def get_read_session_factory(
+    request: Request,
+    current_user: User = Depends(get_current_active_user),
+) -> Callable[[], AsyncSession]:
+    """
+    Session factory for read-only endpoints: a replica, unless this user
+    wrote within READ_YOUR_WRITES_SECONDS, then the primary.
+    """
+    if read_your_writes.active(current_user.email, request.cookies.get(READ_YOUR_WRITES_COOKIE)):
+        return SessionLocal
+    return ReplicaSessionLocal
+
+async def get_read_db(
+    session_factory: Callable[[], AsyncSession] = Depends(get_read_session_factory),
+) -> AsyncGenerator[AsyncSession, None]:
+    async with session_factory() as db:
+        yield db 
\ No newline at end of file
@@ -0,0 +1,154 @@
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api import deps
+from app.core.serialization import json_rows_response, rows_to_dicts
+from app.crud import appointment as appointment_crud
+from app.schemas.appointment import (
+    Appointment, AppointmentCreate, AppointmentUpdate, Availability, CalendarEntry, as_naive_utc
+)
+
+router = APIRouter()
+
+def _conflict(conflicts) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail={
+            "message": "The provider already has an appointment at that time",
+            "conflicts": jsonable_encoder(rows_to_dicts(conflicts)),
+        },
+    )
+
+@router.get("/", response_model=List[CalendarEntry])
+async def read_calendar(
+    db: AsyncSession = Depends(deps.get_read_db),
+    day: date = Query(default_factory=date.today, alias="date"),
+    view: str = Query("day", pattern="^(day|week)$"),
+    provider_id: Optional[int] = None,
+    patient_id: Optional[int] = None,
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Calendar for one day, or the Monday-to-Sunday week containing `date`,
+    optionally for one provider or patient. Includes patient names.
+    """
+    if view == "week":
+        day -= timedelta(days=day.weekday())
+    start = datetime.combine(day, time.min)
+    end = start + timedelta(days=7 if view == "week" else 1)
+    rows = await appointment_crud.get_calendar(
+        db, tenant_id, start, end, provider_id=provider_id, patient_id=patient_id
+    )
+    return json_rows_response(rows)
+
+@router.get("/availability", response_model=Availability)
+async def check_availability(
+    db: AsyncSession = Depends(deps.get_read_db),
+    provider_id: int = Query(...),
+    start_time: datetime = Query(...),
+    end_time: datetime = Query(...),
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Whether the provider is free for the slot, and what is in the way if not.
+    """
+    start_time, end_time = as_naive_utc(start_time), as_naive_utc(end_time)
+    if end_time <= start_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_time must be after start_time"
+        )
+    conflicts = await appointment_crud.find_conflicts(
+        db, tenant_id, provider_id, start_time, end_time
+    )
+    return {"available": not conflicts, "conflicts": rows_to_dicts(conflicts)}
+
+@router.post("/", response_model=Appointment)
+async def create_appointment(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    appointment_in: AppointmentCreate,
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Book an appointment; 409 if the provider is already booked for the slot.
+    """
+    try:
+        appointment, conflicts = await appointment_crud.create_appointment(
+            db, tenant_id, appointment_in
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if appointment is None:
+        raise _conflict(conflicts)
+    return appointment
+
+@router.get("/{appointment_id}", response_model=Appointment)
+async def read_appointment(
+    *,
+    db: AsyncSession = Depends(deps.get_read_db),
+    appointment_id: int,
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Get appointment by ID.
+    """
+    appointment = await appointment_crud.get_appointment(db, tenant_id, appointment_id)
+    if not appointment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Appointment not found"
+        )
+    return appointment
+
+@router.put("/{appointment_id}", response_model=Appointment)
+async def update_appointment(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    appointment_id: int,
+    appointment_in: AppointmentUpdate,
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Reschedule or edit an appointment; 409 if the new slot is taken.
+    """
+    appointment = await appointment_crud.get_appointment(db, tenant_id, appointment_id)
+    if not appointment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Appointment not found"
+        )
+    try:
+        appointment, conflicts = await appointment_crud.update_appointment(
+            db, appointment, appointment_in
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if appointment is None:
+        raise _conflict(conflicts)
+    return appointment
+
+@router.delete("/{appointment_id}", response_model=bool)
+async def delete_appointment(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    appointment_id: int,
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Delete an appointment. Prefer setting status to "cancelled", which keeps the history.
+    """
+    if not await appointment_crud.delete_appointment(db, tenant_id, appointment_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Appointment not found"
+        )
+    return True
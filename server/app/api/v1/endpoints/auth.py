@@ -1,28 +1,30 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
 from app.schemas.user import UserCreate, UserLogin, User, Token
 from app.services.auth import create_user, login_user
 from app.core.security import get_current_user
+from app.core.principal_cache import principal_cache
+from app.services.password_hasher import password_hasher
 
 router = APIRouter()
 
 @router.post("/register")
-def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     Register a new user.
     """
-    return create_user(db=db, user=user)
+    return await create_user(db=db, user=user)
 
 @router.post("/login")
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
     """
     Login user and return JWT token.
     """
-    return login_user(db=db, user_data=user_data)
+    return await login_user(db=db, user_data=user_data)
 
 @router.get("/me")
-def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: User = Depends(get_current_user)):
     """
     Get current user information.
     """
@@ -30,4 +32,18 @@ def get_me(current_user: User = Depends(get_current_user)):
         "id": str(current_user.id),
         "email": current_user.email,
         "name": current_user.name
-    } 
\ No newline at end of file
+    } 
+
+@router.get("/cache/stats")
+async def get_principal_cache_stats(current_user: User = Depends(get_current_user)):
+    """
+    Get hit/miss counters for the authenticated-principal cache.
+    """
+    return principal_cache.stats()
+
+@router.get("/password-hasher/stats")
+async def get_password_hasher_stats(current_user: User = Depends(get_current_user)):
+    """
+    Get queue depth and latency metrics for the password hashing pool.
+    """
+    return password_hasher.stats()
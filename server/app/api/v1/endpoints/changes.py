@@ -0,0 +1,86 @@
+import asyncio
+from typing import Optional
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+from app.api import deps
+from app.core.change_feed import change_feed
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.schemas.user import User
+
+router = APIRouter()
+
+async def _authenticate(token: Optional[str]) -> User:
+    # A short-lived session: holding one for the life of a stream would pin
+    # a pooled connection per subscriber
+    async with SessionLocal() as db:
+        user = await deps.authenticate(db, token)
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return user
+
+async def get_stream_user(
+    token: Optional[str] = Depends(deps.oauth2_scheme),
+    access_token: Optional[str] = Query(None, description="For clients that cannot set headers"),
+) -> User:
+    return await _authenticate(token or access_token)
+
+async def _event_stream(tenant_id: int):
+    async with change_feed.subscribe(tenant_id) as queue:
+        yield b"retry: 3000\n\n"
+        while True:
+            try:
+                payload = await asyncio.wait_for(
+                    queue.get(), settings.CHANGE_FEED_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # Keeps proxies from closing an idle stream
+                yield b": keepalive\n\n"
+                continue
+            yield b"event: %s\ndata: %s\n\n" % (payload["type"].encode(), orjson.dumps(payload))
+
+@router.get("/stream")
+async def stream_changes(current_user: User = Depends(get_stream_user)):
+    """
+    Server-sent events for patient changes in the user's clinic
+    (patient.created, patient.updated, patient.deleted), and resync when
+    events were missed and lists and dashboard stats should be refetched.
+    """
+    return StreamingResponse(
+        _event_stream(current_user.tenant_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.websocket("/ws")
+async def change_socket(websocket: WebSocket, access_token: Optional[str] = None):
+    """
+    The same events as /stream over a WebSocket, one JSON message each.
+    """
+    try:
+        user = await _authenticate(access_token)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+
+    async with change_feed.subscribe(user.tenant_id) as queue:
+        # Clients need not send anything; receiving only notices the disconnect
+        received = asyncio.ensure_future(websocket.receive())
+        next_event = asyncio.ensure_future(queue.get())
+        try:
+            while True:
+                await asyncio.wait({next_event, received}, return_when=asyncio.FIRST_COMPLETED)
+                if received.done():
+                    if received.result()["type"] == "websocket.disconnect":
+                        break
+                    received = asyncio.ensure_future(websocket.receive())
+                if next_event.done():
+                    await websocket.send_text(orjson.dumps(next_event.result()).decode())
+                    next_event = asyncio.ensure_future(queue.get())
+        except WebSocketDisconnect:
+            pass
+        finally:
+            received.cancel()
+            next_event.cancel()
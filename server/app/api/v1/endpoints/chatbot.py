@@ -1,18 +1,48 @@
+import asyncio
+import json
+from typing import AsyncIterator, List
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from app.api import deps
 from app.services.chatbot import chatbot_service
 
 router = APIRouter()
 
+# Messages answered between yields to the event loop while streaming
+STREAM_YIELD_EVERY = 50
+
 class ChatMessage(BaseModel):
     message: str
 
 class ChatResponse(BaseModel):
     response: str
 
+class ChatBatchRequest(BaseModel):
+    messages: List[str] = Field(..., min_length=1, max_length=1000)
+
+class ChatIntent(BaseModel):
+    intent: str
+    score: float
+
+class ChatBatchItem(BaseModel):
+    index: int
+    response: str
+    intents: List[ChatIntent]
+
+class ChatBatchResponse(BaseModel):
+    results: List[ChatBatchItem]
+
+def _answer(index: int, message: str) -> dict:
+    response, intents = chatbot_service.answer(message)
+    return {
+        "index": index,
+        "response": response,
+        "intents": [{"intent": intent, "score": score} for intent, score in intents],
+    }
+
 @router.post("/chat", response_model=ChatResponse)
-def chat(
+async def chat(
     *,
     message: ChatMessage,
     current_user = Depends(deps.get_current_active_user),
@@ -27,4 +57,47 @@ def chat(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing chat message: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+@router.post("/chat/batch", response_model=ChatBatchResponse)
+async def chat_batch(
+    *,
+    batch: ChatBatchRequest,
+    current_user = Depends(deps.get_current_active_user),
+):
+    """
+    Classify and answer many messages in one request.
+    """
+    try:
+        return {"results": [_answer(i, m) for i, m in enumerate(batch.messages)]}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error processing chat messages: {str(e)}"
+        )
+
+async def _stream_answers(messages: List[str]) -> AsyncIterator[str]:
+    for i, message in enumerate(messages):
+        try:
+            yield f"data: {json.dumps(_answer(i, message))}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'index': i, 'detail': str(e)})}\n\n"
+        if i % STREAM_YIELD_EVERY == STREAM_YIELD_EVERY - 1:
+            await asyncio.sleep(0)
+    yield "event: done\ndata: {}\n\n"
+
+@router.post("/chat/stream")
+async def chat_stream(
+    *,
+    batch: ChatBatchRequest,
+    current_user = Depends(deps.get_current_active_user),
+):
+    """
+    Answer one or more messages as a Server-Sent Events stream, one `data`
+    event per answer as it is produced, followed by a `done` event.
+    """
+    return StreamingResponse(
+        _stream_answers(batch.messages),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,36 +1,98 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import datetime, timedelta
-from app.db.session import get_db
-from app.models.patient import Patient
-from app.core.security import get_current_user
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime, timedelta
+from app.api import deps
+from app.core.config import settings
+from app.crud import appointment as appointment_crud
+from app.crud import dashboard_counter as counter_crud
+from app.crud import patient_rollup as rollup_crud
 
 router = APIRouter()
 
 @router.get("/stats")
-def get_dashboard_stats(
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
+async def get_dashboard_stats(
+    db: AsyncSession = Depends(deps.get_read_db),
+    tenant_id: int = Depends(deps.get_current_tenant)
 ):
     """
     Get dashboard statistics including total patients, new patients this month,
     and appointments for today.
     """
-    # Get total patients
-    total_patients = db.query(func.count(Patient.id)).scalar()
+    # Read the incrementally maintained counters (see services/dashboard_stats.py)
+    total_key = counter_crud.total_patients_key(tenant_id)
+    month_key = counter_crud.new_patients_key(tenant_id, datetime.utcnow())
+    counters = await counter_crud.get_counters(db, [total_key, month_key])
+    total_patients = counters.get(total_key, 0)
+    new_patients_this_month = counters.get(month_key, 0)
 
-    # Get new patients this month
-    first_day_of_month = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    new_patients_this_month = db.query(func.count(Patient.id))\
-        .filter(Patient.created_at >= first_day_of_month)\
-        .scalar()
-
-    # For now, we'll return 0 for appointments as we haven't implemented that yet
-    appointments_today = 0
+    # Counted from the (tenant_id, start_time, status) index, see crud.appointment
+    today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+    appointments_today = await appointment_crud.count_active_appointments(
+        db, tenant_id, today, today + timedelta(days=1)
+    )
 
     return {
         "totalPatients": total_patients,
         "newPatientsThisMonth": new_patients_this_month,
         "appointmentsToday": appointments_today
-    } 
\ No newline at end of file
+    }
+
+def _period_start(day: date, granularity: str) -> date:
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+def _next_period(start: date, granularity: str) -> date:
+    if granularity == "week":
+        return start + timedelta(days=7)
+    if granularity == "month":
+        return (start + timedelta(days=32)).replace(day=1)
+    return start + timedelta(days=1)
+
+@router.get("/timeseries")
+async def get_patient_timeseries(
+    granularity: str = Query("day", pattern="^(day|week|month)$"),
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    db: AsyncSession = Depends(deps.get_read_db),
+    tenant_id: int = Depends(deps.get_current_tenant)
+):
+    """
+    New and cumulative patients per day, week (from Monday) or month between
+    `from` and `to` inclusive; the last 30 days by default.
+    """
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(status_code=400, detail="from must not be after to")
+    # Widen to whole periods so the first and last buckets are complete
+    start = _period_start(start, granularity)
+    if (end - start).days >= settings.DASHBOARD_TIMESERIES_MAX_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range is limited to {settings.DASHBOARD_TIMESERIES_MAX_DAYS} days"
+        )
+
+    # Answered from the daily rollup (see crud/patient_rollup.py), never from patients
+    total = await rollup_crud.total_before(db, tenant_id, start)
+    new_by_period = {}
+    for day, count in await rollup_crud.get_days(db, tenant_id, start, end):
+        period = _period_start(day, granularity)
+        new_by_period[period] = new_by_period.get(period, 0) + count
+
+    points = []
+    period = start
+    while period <= end:
+        new_patients = new_by_period.get(period, 0)
+        total += new_patients
+        points.append({
+            "period": period.isoformat(),
+            "newPatients": new_patients,
+            "totalPatients": total
+        })
+        period = _next_period(period, granularity)
+
+    return {"granularity": granularity, "points": points}
@@ -0,0 +1,82 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api import deps
+from app.core.serialization import patient_response
+from app.crud import patient as patient_crud
+from app.crud import patient_duplicate as duplicate_crud
+from app.schemas.patient import Patient
+from app.schemas.patient_duplicate import DuplicateStatus, DuplicateSuggestion, MergeRequest
+
+router = APIRouter()
+
+def _suggestion(row) -> DuplicateSuggestion:
+    def patient(prefix: str, patient_id: int) -> dict:
+        return {
+            "id": patient_id,
+            **{name: getattr(row, f"{prefix}_{name}") for name in duplicate_crud.REVIEW_FIELDS},
+        }
+
+    return DuplicateSuggestion(
+        id=row.id,
+        score=row.score,
+        reasons=row.reasons.split(",") if row.reasons else [],
+        status=row.status,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        patient=patient("patient", row.patient_id),
+        duplicate=patient("duplicate", row.duplicate_id),
+    )
+
+@router.get("/", response_model=List[DuplicateSuggestion])
+async def read_duplicates(
+    db: AsyncSession = Depends(deps.get_read_db),
+    status: DuplicateStatus = "pending",
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    The clinic's suggested duplicate pairs from the dedupe job (`python -m app.cli
+    find-duplicates`), most likely first.
+    """
+    rows = await duplicate_crud.get_suggestions(
+        db, tenant_id, status=status, skip=skip, limit=limit
+    )
+    return [_suggestion(row) for row in rows]
+
+@router.post("/{suggestion_id}/dismiss", response_model=DuplicateSuggestion)
+async def dismiss_duplicate(
+    suggestion_id: int,
+    db: AsyncSession = Depends(deps.get_db),
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Mark a pair as different people; later runs will not suggest it again.
+    """
+    if not await duplicate_crud.set_status(db, tenant_id, suggestion_id, "dismissed"):
+        raise HTTPException(status_code=404, detail="Suggestion not found")
+    return _suggestion(await duplicate_crud.get_suggestion(db, tenant_id, suggestion_id))
+
+@router.post("/{suggestion_id}/merge", response_model=Patient)
+async def merge_duplicate(
+    suggestion_id: int,
+    merge: MergeRequest,
+    db: AsyncSession = Depends(deps.get_db),
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Merge the pair into `keep_id`: the other patient's appointments move to
+    it, missing contact details are copied over, and the other is deleted.
+    """
+    suggestion = await duplicate_crud.get_suggestion(db, tenant_id, suggestion_id)
+    if suggestion is None:
+        raise HTTPException(status_code=404, detail="Suggestion not found")
+    pair = (suggestion.patient_id, suggestion.duplicate_id)
+    if merge.keep_id not in pair:
+        raise HTTPException(status_code=400, detail="keep_id must be one of the pair")
+    remove_id = pair[1] if merge.keep_id == pair[0] else pair[0]
+    patient = await patient_crud.merge_patients(db, tenant_id, merge.keep_id, remove_id)
+    if patient is None:
+        raise HTTPException(status_code=404, detail="Patient not found")
+    return patient_response(patient)
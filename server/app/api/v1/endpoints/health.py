@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+from app.core.config import settings
+from app.db.session import ping
+
+router = APIRouter()
+
+@router.get("/live")
+async def liveness():
+    """
+    The process is up and serving requests; never touches the database.
+    """
+    return {"status": "ok"}
+
+@router.get("/ready")
+async def readiness(request: Request):
+    """
+    Ready for traffic: the startup connection has succeeded and the
+    database still answers. 503 otherwise, so load balancers skip this worker.
+    """
+    if not getattr(request.app.state, "db_ready", False):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "starting"},
+        )
+    try:
+        await ping(timeout=settings.DB_CONNECT_TIMEOUT_SECONDS)
+    except Exception:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "database unavailable"},
+        )
+    return {"status": "ok"}
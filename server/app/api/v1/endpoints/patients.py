@@ -1,31 +1,179 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.api import deps
-from app.schemas.patient import Patient, PatientCreate, PatientUpdate
+from app.core.config import settings
+from app.core.serialization import ORJSONResponse, json_rows_response, patient_response, rows_to_dicts
+from app.core.http_cache import (
+    collection_etag, http_date, is_not_modified, resource_etag, resource_etag_versions
+)
+from app.schemas.patient import (
+    Patient, PatientCreate, PatientIds, PatientPage, PatientPatch, PatientSummary, PatientUpdate
+)
 from app.crud import patient as patient_crud
+from app.services.patient_import import import_patients
+from app.services.patient_export import export_patients
 
 router = APIRouter()
 
-@router.get("/", response_model=List[Patient])
-def read_patients(
-    db: Session = Depends(deps.get_db),
+def _not_modified(etag: str, modified) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_validators(etag, modified))
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated columns to return (id is always included), "
+    "or `summary` for the list-view columns"
+)
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if fields is None:
+        return None
+    if fields.strip() == "summary":
+        return list(PatientSummary.model_fields)
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in patient_crud.PATIENT_FIELDS]
+    if not names or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested"
+        )
+    return names
+
+def _validators(etag: str, modified) -> dict:
+    headers = {"ETag": etag}
+    if modified is not None:
+        headers["Last-Modified"] = http_date(modified)
+    return headers
+
+@router.get("/", response_model=Union[PatientPage, List[Patient]])
+async def read_patients(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_read_db),
     skip: int = 0,
-    limit: int = 100,
-    current_user = Depends(deps.get_current_active_user),
+    limit: int = Query(100, ge=1),
+    paginate: str = Query("offset", pattern="^(offset|cursor)$"),
+    after: Optional[str] = None,
+    sort: str = Query("id", pattern="^(id|last_name|created_at)$"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None),
+    tenant_id: int = Depends(deps.get_current_tenant),
 ):
     """
     Retrieve patients.
+
+    Defaults to offset paging (`skip`/`limit`), which returns a plain list.
+    Passing `paginate=cursor` or an `after` cursor switches to keyset paging,
+    which returns `{items, next_cursor}`; pass `next_cursor` back as `after`.
+    `fields` selects only the listed columns (in cursor mode the sort column
+    is included too), e.g. `fields=summary` leaves out medical_history.
+
+    Responses carry an ETag derived from the ids and modification times of
+    the rows on the page; a matching If-None-Match gets a 304 without a body.
+    There is no Last-Modified, as a delete can change a page without making
+    any of its rows newer. Rows are encoded straight to JSON without per-row
+    model validation.
     """
-    patients = patient_crud.get_patients(db, skip=skip, limit=limit)
-    return patients
+    selected = _parse_fields(fields)
+    keyset = paginate == "cursor" or after is not None
+    if keyset:
+        try:
+            rows, next_cursor = await patient_crud.get_patients_page(
+                db, tenant_id, sort=sort, after=after, limit=limit, fields=selected
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+    else:
+        rows = await patient_crud.get_patients(
+            db, tenant_id, skip=skip, limit=limit, fields=selected
+        )
+    items = rows_to_dicts(rows)
+    versions = [(item["id"], item.pop("_modified")) for item in items]
+    etag = collection_etag(f"patients-{tenant_id}", versions, request.url.query)
+    if is_not_modified(if_none_match, None, etag, None):
+        return _not_modified(etag, None)
+    headers = _validators(etag, None)
+    if keyset:
+        return ORJSONResponse({"items": items, "next_cursor": next_cursor}, headers=headers)
+    return ORJSONResponse(items, headers=headers)
+
+@router.get("/search", response_model=List[Patient])
+async def search_patients(
+    db: AsyncSession = Depends(deps.get_read_db),
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Search patients by name, email or phone fragment, best matches first.
+    """
+    return json_rows_response(
+        await patient_crud.search_patients(
+            db, tenant_id, q=q, limit=limit, fields=_parse_fields(fields)
+        )
+    )
+
+@router.post("/import")
+async def import_patients_upload(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_db),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    on_conflict: str = Query("skip", pattern="^(skip|update)$"),
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Bulk import patients from a CSV (with header row) or NDJSON request body.
+
+    The body is parsed as it streams in and written in batches; the response
+    reports inserted/updated counts and per-row errors. `on_conflict` decides
+    whether rows whose email already exists are skipped or overwrite the existing patient.
+    """
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        if "csv" in content_type:
+            format = "csv"
+        elif "ndjson" in content_type or "jsonl" in content_type:
+            format = "ndjson"
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Send text/csv or application/x-ndjson, or pass ?format="
+            )
+    return await import_patients(
+        db, tenant_id, request.stream(), format=format, on_conflict=on_conflict
+    )
+
+@router.get("/export")
+async def export_patients_download(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    gzip: bool = False,
+    session_factory = Depends(deps.get_read_session_factory),
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Download all of the clinic's patients as CSV or NDJSON, streamed from a server-side cursor.
+    """
+    filename = f"patients.{format}"
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        export_patients(tenant_id, format, compress=gzip, session_factory=session_factory),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 @router.post("/", response_model=Patient)
-def create_patient(
+async def create_patient(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     patient_in: PatientCreate,
-    current_user = Depends(deps.get_current_active_user),
+    tenant_id: int = Depends(deps.get_current_tenant),
 ):
     """
     Create new patient.
@@ -34,7 +182,9 @@ def create_patient(
         # Convert the input to dict and validate
         patient_data = patient_in.dict()
         # Create the patient
-        patient = patient_crud.create_patient(db=db, patient=patient_in)
+        patient = await patient_crud.create_patient(
+            db=db, tenant_id=tenant_id, patient=patient_in
+        )
         return patient
     except Exception as e:
         raise HTTPException(
@@ -42,60 +192,164 @@ def create_patient(
             detail=str(e)
         )
 
+def _check_bulk_size(count: int) -> None:
+    if count > settings.BULK_MUTATION_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.BULK_MUTATION_MAX_ITEMS} patients per request"
+        )
+
+@router.patch("/")
+async def bulk_update_patients(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    changes: List[PatientPatch],
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Apply partial updates to many patients in one transaction.
+
+    Each item holds a patient `id` and only the fields to change. Returns
+    the updated ids and the ids that were not found; a change that would
+    duplicate an email rejects the whole batch with 409.
+    """
+    _check_bulk_size(len(changes))
+    ids = [change.id for change in changes]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each patient may appear only once"
+        )
+    try:
+        updated, missing = await patient_crud.bulk_update_patients(
+            db, tenant_id, [change.model_dump(exclude_unset=True) for change in changes]
+        )
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e.orig)
+        )
+    return {"updated": updated, "notFound": missing}
+
+@router.delete("/")
+async def bulk_delete_patients(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    body: PatientIds,
+    tenant_id: int = Depends(deps.get_current_tenant),
+):
+    """
+    Delete many patients in one statement; returns deleted and unknown ids.
+    """
+    _check_bulk_size(len(body.ids))
+    deleted = await patient_crud.bulk_delete_patients(db, tenant_id, body.ids)
+    return {"deleted": deleted, "notFound": sorted(set(body.ids) - set(deleted))}
+
 @router.get("/{patient_id}", response_model=Patient)
-def read_patient(
+async def read_patient(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     patient_id: int,
-    current_user = Depends(deps.get_current_active_user),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    tenant_id: int = Depends(deps.get_current_tenant),
 ):
     """
     Get patient by ID.
+
+    Supports If-None-Match / If-Modified-Since; a conditional request for an
+    unchanged patient gets a 304 without loading the full row.
+    With `fields`, only those columns are loaded and returned; the ETag then
+    differs from the full representation's.
     """
-    patient = patient_crud.get_patient(db=db, patient_id=patient_id)
+    selected = _parse_fields(fields)
+    if selected is not None:
+        found = await patient_crud.get_patient_fields(db, tenant_id, patient_id, selected)
+        if found is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Patient not found"
+            )
+        values, modified = found
+        etag = resource_etag("patient", patient_id, modified, ",".join(selected))
+        if is_not_modified(if_none_match, if_modified_since, etag, modified):
+            return _not_modified(etag, modified)
+        return ORJSONResponse(values, headers=_validators(etag, modified))
+    if if_none_match is not None or if_modified_since is not None:
+        modified = await patient_crud.get_patient_modified(db, tenant_id, patient_id)
+        if modified is not None:
+            etag = resource_etag("patient", patient_id, modified)
+            if is_not_modified(if_none_match, if_modified_since, etag, modified):
+                return _not_modified(etag, modified)
+    patient = await patient_crud.get_patient(db=db, tenant_id=tenant_id, patient_id=patient_id)
     if not patient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Patient not found"
         )
-    return patient
+    modified = patient.updated_at or patient.created_at
+    return patient_response(
+        patient, headers=_validators(resource_etag("patient", patient.id, modified), modified)
+    )
 
 @router.put("/{patient_id}", response_model=Patient)
-def update_patient(
+async def update_patient(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     patient_id: int,
     patient_in: PatientUpdate,
-    current_user = Depends(deps.get_current_active_user),
+    if_match: Optional[str] = Header(None),
+    tenant_id: int = Depends(deps.get_current_tenant),
 ):
     """
     Update a patient.
+
+    With If-Match, the update only applies if the patient still has that
+    ETag (checked in the UPDATE itself); otherwise 412 Precondition Failed.
     """
-    patient = patient_crud.get_patient(db=db, patient_id=patient_id)
-    if not patient:
+    expected = None
+    if if_match is not None:
+        expected = resource_etag_versions(if_match, "patient", patient_id)
+    patient = await patient_crud.update_patient(
+        db=db,
+        tenant_id=tenant_id,
+        patient_id=patient_id,
+        patient=patient_in,
+        expected_versions=expected,
+    )
+    if patient is None:
+        # Only the failure path pays for a second query, to tell 404 from 412
+        modified = await patient_crud.get_patient_modified(db, tenant_id, patient_id)
+        if modified is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Patient not found"
+            )
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient not found"
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Patient was modified by someone else",
+            headers={"ETag": resource_etag("patient", patient_id, modified)},
         )
-    patient = patient_crud.update_patient(
-        db=db, patient_id=patient_id, patient=patient_in
+    modified = patient.updated_at or patient.created_at
+    return patient_response(
+        patient, headers=_validators(resource_etag("patient", patient.id, modified), modified)
     )
-    return patient
 
 @router.delete("/{patient_id}", response_model=bool)
-def delete_patient(
+async def delete_patient(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     patient_id: int,
-    current_user = Depends(deps.get_current_active_user),
+    tenant_id: int = Depends(deps.get_current_tenant),
 ):
     """
     Delete a patient.
     """
-    patient = patient_crud.get_patient(db=db, patient_id=patient_id)
-    if not patient:
+    if not await patient_crud.delete_patient(db=db, tenant_id=tenant_id, patient_id=patient_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Patient not found"
         )
-    return patient_crud.delete_patient(db=db, patient_id=patient_id) 
\ No newline at end of file
+    return True
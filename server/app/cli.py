@@ -0,0 +1,139 @@
+"""
+Maintenance commands, run with `python -m app.cli <command>`.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from datetime import date
+from app.crud import clinic as clinic_crud
+from app.crud import user as user_crud
+from app.db import partitioning
+from app.db.session import SessionLocal
+from app.services import dashboard_stats, patient_dedupe
+
+async def reconcile_stats(fix: bool) -> int:
+    async with SessionLocal() as db:
+        mismatches = await dashboard_stats.reconcile_counters(db)
+        print(json.dumps({"mismatches": mismatches}, indent=2))
+        if mismatches and fix:
+            await dashboard_stats.rebuild_counters(db)
+            print("Counters rebuilt")
+            return 0
+    return 1 if mismatches else 0
+
+async def rebuild_stats() -> int:
+    async with SessionLocal() as db:
+        counters = await dashboard_stats.rebuild_counters(db)
+    print(json.dumps(counters, indent=2))
+    return 0
+
+async def backfill_timeseries(start, end) -> int:
+    async with SessionLocal() as db:
+        counts = await dashboard_stats.backfill_daily_rollups(db, start, end)
+    print(f"Backfilled {len(counts)} days, {sum(counts.values())} patients")
+    return 0
+
+async def find_duplicates(min_score, clinic_id) -> int:
+    async with SessionLocal() as db:
+        if clinic_id is None:
+            clinic_ids = [clinic.id for clinic in await clinic_crud.get_clinics(db)]
+        else:
+            clinic_ids = [clinic_id]
+        stats = {}
+        for tenant_id in clinic_ids:
+            stats[tenant_id] = await patient_dedupe.find_duplicates(
+                db, tenant_id, min_score=min_score
+            )
+    print(json.dumps(stats, indent=2))
+    return 0
+
+async def create_clinic(name, slug) -> int:
+    async with SessionLocal() as db:
+        try:
+            clinic = await clinic_crud.create_clinic(db, name, slug)
+        except ValueError as e:
+            print(e)
+            return 1
+        if await partitioning.partition_strategy(db) == "list":
+            partition = await partitioning.create_clinic_partition(db, clinic.id)
+            print(f"Created partition {partition}")
+        await db.commit()
+        print(f"Created clinic {clinic.id}")
+    return 0
+
+async def move_user(email, clinic_id) -> int:
+    async with SessionLocal() as db:
+        user = await user_crud.get_user_by_email(db, email)
+        if user is None or await clinic_crud.get_clinic(db, clinic_id) is None:
+            print("Unknown user or clinic")
+            return 1
+        # Also tells the running web workers to drop the cached principal
+        await user_crud.update_user(db, user.id, {"tenant_id": clinic_id})
+    print(f"Moved {email} to clinic {clinic_id}")
+    return 0
+
+async def partition_patients(strategy, partitions) -> int:
+    async with SessionLocal() as db:
+        try:
+            created = await partitioning.partition_patients(db, strategy, partitions)
+        except ValueError as e:
+            print(e)
+            return 1
+    print(f"Partitioned patients by {strategy}: {', '.join(created)}")
+    return 0
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    reconcile = commands.add_parser(
+        "reconcile-stats", help="Check dashboard counters against real counts"
+    )
+    reconcile.add_argument("--fix", action="store_true", help="Rebuild counters on mismatch")
+    commands.add_parser("rebuild-stats", help="Recompute dashboard counters")
+    backfill = commands.add_parser(
+        "backfill-timeseries", help="Recompute the daily patient rollup"
+    )
+    backfill.add_argument("--from", dest="start", type=date.fromisoformat, help="First day, YYYY-MM-DD")
+    backfill.add_argument("--to", dest="end", type=date.fromisoformat, help="Last day, YYYY-MM-DD")
+
+    dedupe = commands.add_parser(
+        "find-duplicates", help="Score likely duplicate patients for review"
+    )
+    dedupe.add_argument("--min-score", type=float, help="Defaults to DEDUPE_MIN_SCORE")
+    dedupe.add_argument("--clinic", type=int, help="Only this clinic id; all clinics by default")
+
+    clinic = commands.add_parser("create-clinic", help="Add a clinic (tenant)")
+    clinic.add_argument("name")
+    clinic.add_argument("slug")
+    move = commands.add_parser("move-user", help="Assign a user to another clinic")
+    move.add_argument("email")
+    move.add_argument("clinic_id", type=int)
+    partition = commands.add_parser(
+        "partition-patients", help="Convert patients to a table partitioned by clinic (PostgreSQL)"
+    )
+    partition.add_argument("--by", choices=["list", "hash"], default="list")
+    partition.add_argument(
+        "--partitions", type=int, default=8, help="Number of hash partitions"
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "reconcile-stats":
+        return asyncio.run(reconcile_stats(args.fix))
+    if args.command == "rebuild-stats":
+        return asyncio.run(rebuild_stats())
+    if args.command == "backfill-timeseries":
+        return asyncio.run(backfill_timeseries(args.start, args.end))
+    if args.command == "find-duplicates":
+        return asyncio.run(find_duplicates(args.min_score, args.clinic))
+    if args.command == "create-clinic":
+        return asyncio.run(create_clinic(args.name, args.slug))
+    if args.command == "move-user":
+        return asyncio.run(move_user(args.email, args.clinic_id))
+    if args.command == "partition-patients":
+        return asyncio.run(partition_patients(args.by, args.partitions))
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+import orjson
+from app.core.config import settings
+from app.core.metrics import (
+    ADMISSION_IN_FLIGHT, ADMISSION_QUEUED, ADMISSION_REJECTED, ADMISSION_WAIT_SECONDS
+)
+from app.db.routing import SAFE_METHODS
+
+# Path prefixes with their own route class; other /api paths are reads or
+# writes by method. Change-feed streams stay open for minutes and never hold
+# a database connection, so they are not admission controlled.
+ROUTE_CLASS_PREFIXES: List[Tuple[str, Optional[str]]] = [
+    ("/api/auth", "auth"),
+    ("/api/v1/chatbot", "chat"),
+    ("/api/v1/changes", None),
+]
+
+class Rejected(Exception):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+class ConcurrencyLimiter:
+    """
+    Lets at most `limit` requests run at once. Up to `queue_size` more wait
+    (first come, first served) for at most `queue_timeout` seconds; anything
+    beyond that is rejected straight away rather than piling up on the
+    database pool's checkout timeout.
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        if self.in_flight < self.limit and not self._waiters:
+            self._admit(0.0)
+            return
+        if len(self._waiters) >= self.queue_size:
+            ADMISSION_REJECTED.labels(self.name, "queue_full").inc()
+            raise Rejected("queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        ADMISSION_QUEUED.labels(self.name).inc()
+        queued_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done():
+                # The slot was handed over just as we gave up; pass it on
+                self.release()
+            else:
+                waiter.cancel()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            ADMISSION_REJECTED.labels(self.name, "timeout").inc()
+            raise Rejected("timeout")
+        finally:
+            ADMISSION_QUEUED.labels(self.name).dec()
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+        # The releasing request handed its slot over, so in_flight is unchanged
+        ADMISSION_WAIT_SECONDS.labels(self.name).observe(time.perf_counter() - queued_at)
+
+    def _admit(self, waited: float) -> None:
+        self.in_flight += 1
+        ADMISSION_IN_FLIGHT.labels(self.name).inc()
+        ADMISSION_WAIT_SECONDS.labels(self.name).observe(waited)
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+        ADMISSION_IN_FLIGHT.labels(self.name).dec()
+
+def build_limiters() -> Dict[str, ConcurrencyLimiter]:
+    limits = {
+        "reads": (settings.ADMISSION_READS_CONCURRENCY, settings.ADMISSION_READS_QUEUE),
+        "writes": (settings.ADMISSION_WRITES_CONCURRENCY, settings.ADMISSION_WRITES_QUEUE),
+        "auth": (settings.ADMISSION_AUTH_CONCURRENCY, settings.ADMISSION_AUTH_QUEUE),
+        "chat": (settings.ADMISSION_CHAT_CONCURRENCY, settings.ADMISSION_CHAT_QUEUE),
+    }
+    return {
+        name: ConcurrencyLimiter(name, limit, queue_size, settings.ADMISSION_QUEUE_TIMEOUT_SECONDS)
+        for name, (limit, queue_size) in limits.items()
+        if limit > 0
+    }
+
+def route_class(method: str, path: str) -> Optional[str]:
+    """
+    The route class a request is admitted under, or None if it is not limited.
+    """
+    if not path.startswith("/api/"):
+        # Health checks, metrics and docs must answer even when overloaded
+        return None
+    for prefix, name in ROUTE_CLASS_PREFIXES:
+        if path.startswith(prefix):
+            return name
+    return "reads" if method in SAFE_METHODS else "writes"
+
+class AdmissionControlMiddleware:
+    """
+    Plain ASGI middleware applying a ConcurrencyLimiter per route class for
+    the whole request, including streamed response bodies. Limits are per
+    server process. Rejected requests get 503 with Retry-After.
+    """
+
+    def __init__(self, app, limiters: Optional[Dict[str, ConcurrencyLimiter]] = None):
+        self.app = app
+        self.limiters = build_limiters() if limiters is None else limiters
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        limiter = self.limiters.get(route_class(scope["method"], scope["path"]))
+        if limiter is None:
+            return await self.app(scope, receive, send)
+
+        try:
+            await limiter.acquire()
+        except Rejected:
+            return await self._reject(send)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    async def _reject(self, send) -> None:
+        body = orjson.dumps({"detail": "Server is busy, please retry"})
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(settings.ADMISSION_RETRY_AFTER_SECONDS).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
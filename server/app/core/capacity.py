@@ -0,0 +1,27 @@
+"""
+Process and connection sizing shared by gunicorn.conf.py and the settings.
+Kept free of app imports so the gunicorn master can use it before any
+worker (and its settings) exists.
+"""
+from typing import Tuple
+
+# Connections this deployment may hold in total; Postgres defaults to
+# max_connections=100, leaving room for migrations, psql and replication
+DEFAULT_CONNECTION_BUDGET = 80
+
+def plan_workers(cpu_count: int, connection_budget: int, min_connections: int = 4) -> int:
+    """
+    One async worker per core, but no more than the connection budget can
+    give a pool of at least `min_connections` each.
+    """
+    return max(1, min(cpu_count, connection_budget // min_connections))
+
+def plan_pool(workers: int, connection_budget: int) -> Tuple[int, int]:
+    """
+    Per-worker (pool_size, max_overflow) so that all workers together never
+    exceed the budget. About half the share is kept open, the rest is
+    overflow that is closed again once the burst is over.
+    """
+    share = max(2, connection_budget // max(1, workers))
+    pool_size = max(1, min(10, share // 2))
+    return pool_size, share - pool_size
@@ -0,0 +1,179 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+import orjson
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.db.session import get_async_database_url
+from app.schemas.patient import PatientSummary
+
+CHANNEL = "patient_changes"
+# Carries the token subjects (emails) whose cached principal is stale
+PRINCIPAL_CHANNEL = "principal_invalidations"
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_BYTES = 7900
+# Tells subscribers that events were lost and they should refetch
+RESYNC = {"type": "resync"}
+SUMMARY_FIELDS = tuple(PatientSummary.model_fields)
+# Session.info key for events waiting on the transaction to commit
+PENDING_KEY = "change_feed_pending"
+
+def patient_event(
+    tenant_id: int, type: str, ids: Iterable[int], patient: Any = None
+) -> Dict[str, Any]:
+    """
+    A change event in a clinic: `type` is patient.created, patient.updated or
+    patient.deleted; single-row changes also carry the list view columns.
+    """
+    payload: Dict[str, Any] = {"type": type, "tenant_id": tenant_id, "ids": list(ids)}
+    if patient is not None:
+        payload["patient"] = {field: getattr(patient, field) for field in SUMMARY_FIELDS}
+    return payload
+
+class ChangeFeed:
+    """
+    Fans committed patient changes out to the subscribers of this process.
+
+    On Postgres, events travel through NOTIFY inside the writing transaction
+    and come back through one LISTEN connection per process, so every worker
+    sees every change and only committed ones. Elsewhere (SQLite for local
+    runs) events are held on the session and dispatched in-process after
+    commit, so only the worker that made the change sees it. Subscribers
+    only receive events of their own clinic.
+
+    The same connection also receives principal cache invalidations, so a
+    user changed in one process (or by the CLI) is dropped from every
+    worker's cache as soon as the change commits.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        # Subscriber queue -> the clinic it follows
+        self._subscribers: Dict[asyncio.Queue, int] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def uses_notify(self) -> bool:
+        return get_async_database_url(settings.DATABASE_URL).startswith("postgresql")
+
+    @asynccontextmanager
+    async def subscribe(self, tenant_id: int) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[queue] = tenant_id
+        try:
+            yield queue
+        finally:
+            self._subscribers.pop(queue, None)
+
+    def dispatch(self, payload: Dict[str, Any]) -> None:
+        # Events without a clinic (resync after a lost connection) go to everyone
+        tenant_id = payload.get("tenant_id")
+        for queue, subscribed in list(self._subscribers.items()):
+            if tenant_id is not None and subscribed != tenant_id:
+                continue
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                # A slow consumer gets one resync instead of a growing backlog
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC)
+
+    async def publish(self, db: AsyncSession, payload: Dict[str, Any]) -> None:
+        """
+        Send `payload` once the session's current transaction commits;
+        nothing is sent if it rolls back. Call before committing.
+        """
+        data = orjson.dumps(payload)
+        if len(data) > MAX_NOTIFY_BYTES:
+            payload = {**RESYNC, "tenant_id": payload.get("tenant_id")}
+            data = orjson.dumps(payload)
+        if db.get_bind().dialect.name == "postgresql":
+            await db.execute(select(func.pg_notify(CHANNEL, data.decode())))
+        else:
+            db.sync_session.info.setdefault(PENDING_KEY, []).append(payload)
+
+    async def invalidate_principals(self, db: AsyncSession, subjects: Iterable[str]) -> None:
+        """
+        Drop the subjects' cached principals in every process once the
+        session's current transaction commits. Postgres only: elsewhere
+        there is a single process, which invalidates its own cache. Call
+        before committing.
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            data = orjson.dumps(sorted(set(subjects))).decode()
+            await db.execute(select(func.pg_notify(PRINCIPAL_CHANNEL, data)))
+
+    def _on_notify(self, connection, pid, channel, data) -> None:
+        if channel == PRINCIPAL_CHANNEL:
+            for subject in orjson.loads(data):
+                principal_cache.invalidate(subject)
+            return
+        self.dispatch(orjson.loads(data))
+
+    async def _listen(self) -> None:
+        import asyncpg
+
+        url = make_url(get_async_database_url(settings.DATABASE_URL))
+        dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+        interval, connected_before = 1, False
+        while True:
+            try:
+                connection = await asyncpg.connect(
+                    dsn, timeout=settings.DB_CONNECT_TIMEOUT_SECONDS
+                )
+            except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as e:
+                print(f"Change feed listener cannot connect, retrying in {interval}s: {e}")
+                await asyncio.sleep(interval)
+                interval = min(interval * 2, 30)
+                continue
+            interval = 1
+            try:
+                await connection.add_listener(CHANNEL, self._on_notify)
+                await connection.add_listener(PRINCIPAL_CHANNEL, self._on_notify)
+                if connected_before:
+                    # Changes made while reconnecting were not delivered,
+                    # invalidations included
+                    self.dispatch(RESYNC)
+                    principal_cache.clear()
+                connected_before = True
+                while True:
+                    await asyncio.sleep(settings.CHANGE_FEED_HEARTBEAT_SECONDS)
+                    # Notices a dead connection that never reported closing
+                    await asyncio.wait_for(
+                        connection.execute("SELECT 1"), settings.DB_CONNECT_TIMEOUT_SECONDS
+                    )
+            except (OSError, asyncio.TimeoutError, asyncpg.PostgresError,
+                    asyncpg.InterfaceError) as e:
+                print(f"Change feed listener lost its connection: {e}")
+            finally:
+                connection.terminate()
+
+    def start(self) -> None:
+        if self.uses_notify and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+# Create a singleton instance
+change_feed = ChangeFeed(queue_size=settings.CHANGE_FEED_QUEUE_SIZE)
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_pending(session: Session) -> None:
+    for payload in session.info.pop(PENDING_KEY, ()):
+        change_feed.dispatch(payload)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
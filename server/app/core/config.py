@@ -2,6 +2,7 @@ from pydantic_settings import BaseSettings
 from typing import List
 import os
 from dotenv import load_dotenv
+from app.core.capacity import DEFAULT_CONNECTION_BUDGET, plan_pool
 
 load_dotenv()
 
@@ -16,6 +17,12 @@ class Settings(BaseSettings):
         "postgresql://postgres:postgres@db:5432/dental_clinic"
     )
     
+    # Optional comma-separated read replicas; GET endpoints read from them
+    DATABASE_REPLICA_URLS: str = os.getenv("DATABASE_REPLICA_URLS", "")
+    # After a write, that user's reads stay on the primary this long so they
+    # see their own change despite replication lag
+    READ_YOUR_WRITES_SECONDS: float = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+    
     # CORS
     CORS_ORIGINS: List[str] = [
         "http://localhost",
@@ -31,6 +38,80 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Clinic of users created from scripts (crud.user.create_user, the
+    # benchmark seed); self-registered users get a new clinic of their own
+    DEFAULT_TENANT_ID: int = int(os.getenv("DEFAULT_TENANT_ID", "1"))
+
+    # Authenticated-principal cache (see app/core/principal_cache.py). On
+    # Postgres, user changes are broadcast to every worker through the
+    # change feed's LISTEN connection, so other workers drop a stale entry
+    # within milliseconds of the commit. Two gaps remain, each bounded by the
+    # TTL: a request that read the user just before the commit can re-cache
+    # the old row, and a worker whose listener is reconnecting misses the
+    # broadcast (its cache is cleared once it is back).
+    PRINCIPAL_CACHE_MAX_SIZE: int = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", "10000"))
+    PRINCIPAL_CACHE_TTL_SECONDS: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+
+    # Server processes running this app (exported by gunicorn.conf.py) and the
+    # database connections all of them may hold together
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+    DB_CONNECTION_BUDGET: int = int(os.getenv("DB_CONNECTION_BUDGET", str(DEFAULT_CONNECTION_BUDGET)))
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE") or plan_pool(WEB_CONCURRENCY, DB_CONNECTION_BUDGET)[0])
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW") or plan_pool(WEB_CONCURRENCY, DB_CONNECTION_BUDGET)[1])
+
+    # Password hashing process pool (see app/services/password_hasher.py);
+    # the cores are shared between all server processes
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY))))
+    PASSWORD_HASH_MAX_CONCURRENCY: int = int(os.getenv("PASSWORD_HASH_MAX_CONCURRENCY", str(2 * max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY))))
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS", "5"))
+
+    # Admission control (see app/core/admission.py): requests each route class
+    # may run at once per server process, how many more may wait, and for how
+    # long, before being turned away with 503. A concurrency of 0 disables the limit.
+    ADMISSION_READS_CONCURRENCY: int = int(os.getenv("ADMISSION_READS_CONCURRENCY", str(DB_POOL_SIZE + DB_MAX_OVERFLOW)))
+    ADMISSION_READS_QUEUE: int = int(os.getenv("ADMISSION_READS_QUEUE", str(4 * (DB_POOL_SIZE + DB_MAX_OVERFLOW))))
+    ADMISSION_WRITES_CONCURRENCY: int = int(os.getenv("ADMISSION_WRITES_CONCURRENCY", str(max(1, (DB_POOL_SIZE + DB_MAX_OVERFLOW) // 2))))
+    ADMISSION_WRITES_QUEUE: int = int(os.getenv("ADMISSION_WRITES_QUEUE", str(2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW))))
+    ADMISSION_AUTH_CONCURRENCY: int = int(os.getenv("ADMISSION_AUTH_CONCURRENCY", str(PASSWORD_HASH_MAX_CONCURRENCY)))
+    ADMISSION_AUTH_QUEUE: int = int(os.getenv("ADMISSION_AUTH_QUEUE", str(4 * PASSWORD_HASH_MAX_CONCURRENCY)))
+    ADMISSION_CHAT_CONCURRENCY: int = int(os.getenv("ADMISSION_CHAT_CONCURRENCY", "32"))
+    ADMISSION_CHAT_QUEUE: int = int(os.getenv("ADMISSION_CHAT_QUEUE", "64"))
+    # Kept well under the pool's checkout timeout, so waiting fails fast
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "2"))
+    ADMISSION_RETRY_AFTER_SECONDS: int = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "1"))
+
+    # Dashboard counters are fully recomputed this often to repair drift
+    DASHBOARD_STATS_REBUILD_SECONDS: int = int(os.getenv("DASHBOARD_STATS_REBUILD_SECONDS", "3600"))
+    # Longest range the growth time-series endpoint answers in one request
+    DASHBOARD_TIMESERIES_MAX_DAYS: int = int(os.getenv("DASHBOARD_TIMESERIES_MAX_DAYS", "1830"))
+
+    # Rows validated and inserted per transaction by the bulk patient import
+    IMPORT_BATCH_SIZE: int = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+
+    # Per-attempt limit when connecting at startup and for /health/ready
+    DB_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("DB_CONNECT_TIMEOUT_SECONDS", "5"))
+
+    # Largest number of patients one bulk PATCH/DELETE request may touch
+    BULK_MUTATION_MAX_ITEMS: int = int(os.getenv("BULK_MUTATION_MAX_ITEMS", "500"))
+
+    # Change feed: events buffered per subscriber before it is told to resync,
+    # and the keepalive interval of streams and the LISTEN connection
+    CHANGE_FEED_QUEUE_SIZE: int = int(os.getenv("CHANGE_FEED_QUEUE_SIZE", "100"))
+    CHANGE_FEED_HEARTBEAT_SECONDS: float = float(os.getenv("CHANGE_FEED_HEARTBEAT_SECONDS", "15"))
+
+    # Duplicate detection: minimum score to suggest a pair, and blocks larger
+    # than DEDUPE_MAX_BLOCK_SIZE are compared within a sliding window only
+    DEDUPE_MIN_SCORE: float = float(os.getenv("DEDUPE_MIN_SCORE", "0.8"))
+    DEDUPE_MAX_BLOCK_SIZE: int = int(os.getenv("DEDUPE_MAX_BLOCK_SIZE", "50"))
+    DEDUPE_WINDOW: int = int(os.getenv("DEDUPE_WINDOW", "10"))
+
+    # Chatbot intent keywords, reloaded when the file changes
+    CHATBOT_KEYWORDS_PATH: str = os.getenv(
+        "CHATBOT_KEYWORDS_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(__file__)), "services", "data", "chatbot_keywords.json")
+    )
+    CHATBOT_KEYWORDS_RELOAD_SECONDS: float = float(os.getenv("CHATBOT_KEYWORDS_RELOAD_SECONDS", "5"))
+
     class Config:
         case_sensitive = True
 
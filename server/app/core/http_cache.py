@@ -0,0 +1,101 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, List, Optional, Tuple
+
+_EPOCH = datetime(1970, 1, 1)
+
+def _as_utc(moment: datetime) -> datetime:
+    # Naive timestamps in this app are UTC (datetime.utcnow defaults)
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+def resource_etag(kind: str, id: int, modified: Optional[datetime], variant: str = "") -> str:
+    version = _version(modified)
+    if variant:
+        # Different representations of the same version (e.g. a field subset)
+        digest = hashlib.sha1(variant.encode()).hexdigest()[:16]
+        return f'"{kind}-{id}-{version}-{digest}"'
+    return f'"{kind}-{id}-{version}"'
+
+def resource_etag_versions(header: str, kind: str, id: int) -> Optional[List[datetime]]:
+    """
+    The modification times encoded in the ETags an If-Match header lists for
+    this resource, so the precondition can be checked inside the UPDATE
+    itself. None for `*`, which matches any version. Weak ETags never match,
+    since If-Match uses the strong comparison (RFC 9110 13.1.1).
+    """
+    prefix = f'"{kind}-{id}-'
+    versions = []
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return None
+        micros = candidate[len(prefix):-1]
+        if candidate.startswith(prefix) and candidate.endswith('"') and micros.isdigit():
+            # Naive UTC, like the stored timestamps
+            versions.append(_EPOCH + timedelta(microseconds=int(micros)))
+    return versions
+
+def _version(modified: Optional[datetime]) -> int:
+    return int(_as_utc(modified).timestamp() * 1_000_000) if modified else 0
+
+def collection_etag(
+    kind: str, versions: Iterable[Tuple[int, Optional[datetime]]], variant: str = ""
+) -> str:
+    """
+    ETag for a listing, from the (id, modification time) of every row on it
+    plus whatever makes this view distinct (query string, selected fields,
+    ...): an edit, insert or delete that changes the page changes the ETag.
+    """
+    digest = hashlib.sha1(variant.encode())
+    for id, modified in versions:
+        digest.update(f"|{id}:{_version(modified)}".encode())
+    return f'"{kind}-{digest.hexdigest()[:16]}"'
+
+def http_date(moment: datetime) -> str:
+    return format_datetime(_as_utc(moment).replace(microsecond=0), usegmt=True)
+
+def etag_matches(header: Optional[str], etag: str, weak: bool = False) -> bool:
+    """
+    True if an If-None-Match / If-Match header lists `etag` or is `*`.
+    With `weak` (If-None-Match only), W/ validators compare equal to their
+    strong form; otherwise they never match (RFC 9110 13.1.1).
+    """
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if weak and candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+def not_modified_since(header: Optional[str], modified: Optional[datetime]) -> bool:
+    """
+    True if the resource has not changed since the If-Modified-Since date.
+    """
+    if not header or modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since is None:
+        return False
+    return _as_utc(modified).replace(microsecond=0) <= _as_utc(since)
+
+def is_not_modified(
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+    etag: str,
+    modified: Optional[datetime],
+) -> bool:
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag, weak=True)
+    return not_modified_since(if_modified_since, modified)
@@ -0,0 +1,214 @@
+import os
+import time
+from contextvars import ContextVar
+from typing import Optional
+from prometheus_client import (
+    CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
+from prometheus_client.core import REGISTRY
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "SQL statements executed per HTTP request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL per HTTP request",
+    ["method", "route"],
+)
+DB_STATEMENT_SECONDS = Histogram(
+    "db_statement_duration_seconds",
+    "SQL statement execution time by statement type",
+    ["operation"],
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for (or opening) a pooled connection",
+)
+# Pool occupancy, summed over the live worker processes
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Configured pool size", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out", multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections open beyond pool_size", multiprocess_mode="livesum"
+)
+DB_POOL_IDLE = Gauge(
+    "db_pool_idle", "Idle connections in the pool", multiprocess_mode="livesum"
+)
+CHATBOT_INTENTS = Counter(
+    "chatbot_intents_total",
+    "Chatbot messages answered, by matched topic",
+    ["topic"],
+)
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight_requests",
+    "Requests admitted and running, by route class",
+    ["route_class"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_QUEUED = Gauge(
+    "admission_queued_requests",
+    "Requests waiting for admission, by route class",
+    ["route_class"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_WAIT_SECONDS = Histogram(
+    "admission_wait_seconds",
+    "Time admitted requests waited in the admission queue",
+    ["route_class"],
+)
+ADMISSION_REJECTED = Counter(
+    "admission_rejected_total",
+    "Requests turned away with 503, by route class and reason (queue_full, timeout)",
+    ["route_class", "reason"],
+)
+
+# Only these become label values, so statement text never blows up cardinality
+_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "BEGIN", "COMMIT", "ROLLBACK"}
+
+class _RequestStats:
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+# Per-request statement totals; SQLAlchemy's greenlets share the request task's context
+_request_stats: ContextVar[Optional[_RequestStats]] = ContextVar("request_stats", default=None)
+
+def _route_template(scope) -> str:
+    """
+    The matched route's path template including its router prefix, e.g.
+    /api/v1/patients/{patient_id}. Routes of included routers only know
+    the part after their prefix, so the prefix is recovered from the
+    request path.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return "unmatched"
+    try:
+        rendered = route.path_format.format(**{
+            name: route.param_convertors[name].to_string(value)
+            for name, value in scope.get("path_params", {}).items()
+        })
+    except (AttributeError, KeyError, ValueError):
+        return template
+    path = scope["path"]
+    if path.endswith(rendered):
+        return path[:len(path) - len(rendered)] + template
+    return template
+
+class MetricsMiddleware:
+    """
+    Plain ASGI middleware (no BaseHTTPMiddleware task and queue per request)
+    recording latency and SQL totals per route template. Unmatched paths are
+    grouped under one label so scanners cannot create new series.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status_code = 500
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = _RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_stats.reset(token)
+            template = _route_template(scope)
+            method = scope["method"]
+            REQUEST_LATENCY.labels(method, template, str(status_code)).observe(elapsed)
+            REQUEST_DB_STATEMENTS.labels(method, template).observe(stats.statements)
+            REQUEST_DB_SECONDS.labels(method, template).observe(stats.seconds)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    operation = statement.split(None, 1)[0].upper() if statement else ""
+    DB_STATEMENT_SECONDS.labels(operation if operation in _OPERATIONS else "OTHER").observe(elapsed)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += elapsed
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    The async queue pool, timing how long each checkout waits for a
+    connection (including opening a new one). With `report_occupancy` it
+    also updates the pool gauges after every checkout and return, so each
+    worker's values are current whenever any worker is scraped.
+    """
+
+    report_occupancy = False
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
+            self._report_occupancy()
+
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        self._report_occupancy()
+
+    def _report_occupancy(self) -> None:
+        if not self.report_occupancy:
+            return
+        DB_POOL_SIZE.set(self.size())
+        DB_POOL_CHECKED_OUT.set(self.checkedout())
+        DB_POOL_OVERFLOW.set(max(self.overflow(), 0))
+        DB_POOL_IDLE.set(self.checkedin())
+
+def instrument_engine(engine: AsyncEngine, pool_metrics: bool = True) -> None:
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+    pool = sync_engine.pool
+    if pool_metrics and isinstance(pool, TimedQueuePool):
+        pool.report_occupancy = True
+        pool._report_occupancy()
+
+def render_metrics() -> bytes:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        # Several server processes: aggregate every worker's metrics
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
@@ -0,0 +1,33 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Tuple
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def encode_cursor(sort: str, value: Any, id: int) -> str:
+    """
+    Build an opaque keyset cursor from the last row of a page.
+    """
+    raw = json.dumps([sort, _encode_value(value), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[str, Any, int]:
+    """
+    Decode a cursor produced by encode_cursor into (sort, value, id).
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort, value, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(sort, str) or not isinstance(id, int) or isinstance(id, bool):
+        raise ValueError("Invalid cursor")
+    # Cursors only ever carry ids, names and ISO timestamps
+    if not isinstance(value, (str, int)) or isinstance(value, bool):
+        raise ValueError("Invalid cursor")
+    return sort, value, id
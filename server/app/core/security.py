@@ -3,11 +3,12 @@ from typing import Any, Union, Optional
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.db.session import get_db
 from app.crud import user as user_crud
-from app.schemas.user import TokenData
+from app.core.principal_cache import principal_cache
+from app.schemas.user import TokenData, User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
@@ -21,9 +22,23 @@ def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
+async def get_principal(db: AsyncSession, email: str) -> Optional[User]:
+    """
+    Resolve a token subject to a user snapshot, hitting the database only
+    when the principal cache has no fresh entry.
+    """
+    principal = principal_cache.get(email)
+    if principal is None:
+        user = await user_crud.get_user_by_email(db, email=email)
+        if user is None:
+            return None
+        principal = User.model_validate(user)
+        principal_cache.set(email, principal)
+    return principal
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -43,7 +58,7 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    user = user_crud.get_user_by_email(db, email=token_data.email)
+    user = await get_principal(db, email=token_data.email)
     if user is None:
         raise credentials_exception
     return user 
\ No newline at end of file
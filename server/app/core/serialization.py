@@ -0,0 +1,36 @@
+from typing import Any, Iterable, List
+import orjson
+from pydantic import TypeAdapter
+from starlette.responses import JSONResponse, Response
+from app.schemas.patient import Patient
+
+# Built once at import; building a TypeAdapter compiles its validator and serializer
+patient_adapter = TypeAdapter(Patient)
+patient_list_adapter = TypeAdapter(List[Patient])
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson, which encodes dates, datetimes and
+    row dicts natively.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+def rows_to_dicts(rows: Iterable[Any]) -> List[dict]:
+    """
+    Convert SQLAlchemy Row tuples into plain dicts without any validation;
+    the columns come straight from the database, so their types are trusted.
+    """
+    return [row._asdict() for row in rows]
+
+def json_rows_response(rows: Iterable[Any], **kwargs) -> ORJSONResponse:
+    return ORJSONResponse(rows_to_dicts(rows), **kwargs)
+
+def patient_response(patient: Any, **kwargs) -> Response:
+    """
+    Serialize one ORM patient straight to JSON bytes with the precompiled
+    adapter, skipping FastAPI's separate validation and encoding passes.
+    """
+    body = patient_adapter.dump_json(patient_adapter.validate_python(patient, from_attributes=True))
+    return Response(content=body, media_type="application/json", **kwargs)
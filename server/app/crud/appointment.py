@@ -0,0 +1,179 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import Row, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.appointment import Appointment
+from app.models.patient import Patient
+from app.models.user import User
+from app.schemas.appointment import AppointmentCreate, AppointmentUpdate, MAX_APPOINTMENT_DURATION
+
+APPOINTMENT_COLUMNS = list(Appointment.__table__.columns)
+ACTIVE = Appointment.status != "cancelled"
+
+async def get_appointment(
+    db: AsyncSession, tenant_id: int, appointment_id: int
+) -> Optional[Appointment]:
+    result = await db.execute(
+        select(Appointment)
+        .where(Appointment.tenant_id == tenant_id, Appointment.id == appointment_id)
+    )
+    return result.scalars().first()
+
+async def get_calendar(
+    db: AsyncSession,
+    tenant_id: int,
+    start: datetime,
+    end: datetime,
+    provider_id: Optional[int] = None,
+    patient_id: Optional[int] = None,
+) -> List[Row]:
+    """
+    The clinic's appointments starting in [start, end) with their patient's
+    name, in one query. Served by the (provider_id, start_time),
+    (patient_id, start_time) or (tenant_id, start_time, status) index
+    depending on the filter.
+    """
+    query = (
+        select(
+            *APPOINTMENT_COLUMNS,
+            Patient.first_name.label("patient_first_name"),
+            Patient.last_name.label("patient_last_name"),
+        )
+        .join(
+            Patient,
+            (Patient.tenant_id == Appointment.tenant_id) & (Patient.id == Appointment.patient_id),
+        )
+        .where(
+            Appointment.tenant_id == tenant_id,
+            Appointment.start_time >= start,
+            Appointment.start_time < end,
+        )
+        .order_by(Appointment.start_time, Appointment.id)
+    )
+    if provider_id is not None:
+        query = query.where(Appointment.provider_id == provider_id)
+    if patient_id is not None:
+        query = query.where(Appointment.patient_id == patient_id)
+    result = await db.execute(query)
+    return list(result.all())
+
+async def find_conflicts(
+    db: AsyncSession,
+    tenant_id: int,
+    provider_id: int,
+    start: datetime,
+    end: datetime,
+    exclude_id: Optional[int] = None,
+) -> List[Row]:
+    """
+    Active appointments of the provider overlapping [start, end). No
+    appointment lasts longer than MAX_APPOINTMENT_DURATION, so only those
+    starting after start - MAX_APPOINTMENT_DURATION can overlap; that bound
+    keeps the scan to a short range of the (provider_id, start_time) index
+    however long the history is.
+    """
+    query = select(*APPOINTMENT_COLUMNS).where(
+        Appointment.tenant_id == tenant_id,
+        Appointment.provider_id == provider_id,
+        Appointment.start_time > start - MAX_APPOINTMENT_DURATION,
+        Appointment.start_time < end,
+        Appointment.end_time > start,
+        ACTIVE,
+    )
+    if exclude_id is not None:
+        query = query.where(Appointment.id != exclude_id)
+    result = await db.execute(query.order_by(Appointment.start_time))
+    return list(result.all())
+
+async def count_active_appointments(
+    db: AsyncSession, tenant_id: int, start: datetime, end: datetime
+) -> int:
+    # Answered from the (tenant_id, start_time, status) index alone
+    return await db.scalar(
+        select(func.count())
+        .select_from(Appointment)
+        .where(
+            Appointment.tenant_id == tenant_id,
+            Appointment.start_time >= start,
+            Appointment.start_time < end,
+            ACTIVE,
+        )
+    )
+
+async def _lock_provider(db: AsyncSession, tenant_id: int, provider_id: int) -> None:
+    """
+    Serialize bookings per provider: concurrent transactions checking the
+    same provider's slots wait here, so two of them cannot both see a free
+    slot. Raises ValueError for a provider not in the clinic.
+    """
+    query = select(User.id).where(User.tenant_id == tenant_id, User.id == provider_id)
+    if db.get_bind().dialect.name == "postgresql":
+        query = query.with_for_update()
+    if (await db.execute(query)).first() is None:
+        raise ValueError("Provider not found")
+
+async def _check_patient(db: AsyncSession, tenant_id: int, patient_id: int) -> None:
+    query = select(Patient.id).where(Patient.tenant_id == tenant_id, Patient.id == patient_id)
+    if (await db.execute(query)).first() is None:
+        raise ValueError("Patient not found")
+
+async def create_appointment(
+    db: AsyncSession, tenant_id: int, appointment: AppointmentCreate
+) -> Tuple[Optional[Appointment], List[Row]]:
+    """
+    Book an appointment. Returns (appointment, []) or, if the slot is
+    taken, (None, conflicting appointments) without writing anything.
+    """
+    await _check_patient(db, tenant_id, appointment.patient_id)
+    await _lock_provider(db, tenant_id, appointment.provider_id)
+    if appointment.status != "cancelled":
+        conflicts = await find_conflicts(
+            db, tenant_id, appointment.provider_id, appointment.start_time, appointment.end_time
+        )
+        if conflicts:
+            await db.rollback()
+            return None, conflicts
+    db_appointment = Appointment(**appointment.model_dump(), tenant_id=tenant_id)
+    db.add(db_appointment)
+    await db.commit()
+    await db.refresh(db_appointment)
+    return db_appointment, []
+
+async def update_appointment(
+    db: AsyncSession, db_appointment: Appointment, appointment: AppointmentUpdate
+) -> Tuple[Optional[Appointment], List[Row]]:
+    """
+    Reschedule or edit an appointment, with the same conflict check as
+    booking. The appointment stays in its clinic.
+    """
+    tenant_id = db_appointment.tenant_id
+    if appointment.patient_id != db_appointment.patient_id:
+        await _check_patient(db, tenant_id, appointment.patient_id)
+    await _lock_provider(db, tenant_id, appointment.provider_id)
+    if appointment.status != "cancelled":
+        conflicts = await find_conflicts(
+            db,
+            tenant_id,
+            appointment.provider_id,
+            appointment.start_time,
+            appointment.end_time,
+            exclude_id=db_appointment.id,
+        )
+        if conflicts:
+            await db.rollback()
+            return None, conflicts
+    for field, value in appointment.model_dump().items():
+        setattr(db_appointment, field, value)
+    await db.commit()
+    await db.refresh(db_appointment)
+    return db_appointment, []
+
+async def delete_appointment(db: AsyncSession, tenant_id: int, appointment_id: int) -> bool:
+    result = await db.execute(
+        delete(Appointment)
+        .where(Appointment.tenant_id == tenant_id, Appointment.id == appointment_id)
+        .returning(Appointment.id)
+    )
+    deleted = result.first() is not None
+    await db.commit()
+    return deleted
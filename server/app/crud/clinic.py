@@ -0,0 +1,28 @@
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.clinic import Clinic
+
+async def get_clinic(db: AsyncSession, clinic_id: int) -> Optional[Clinic]:
+    result = await db.execute(select(Clinic).where(Clinic.id == clinic_id))
+    return result.scalars().first()
+
+async def get_clinic_by_slug(db: AsyncSession, slug: str) -> Optional[Clinic]:
+    result = await db.execute(select(Clinic).where(Clinic.slug == slug))
+    return result.scalars().first()
+
+async def get_clinics(db: AsyncSession) -> List[Clinic]:
+    result = await db.execute(select(Clinic).order_by(Clinic.id))
+    return list(result.scalars().all())
+
+async def create_clinic(db: AsyncSession, name: str, slug: str) -> Clinic:
+    """
+    Create a clinic; raises ValueError if the slug is taken. Does not commit,
+    so the caller can create its patients partition in the same transaction.
+    """
+    if await get_clinic_by_slug(db, slug) is not None:
+        raise ValueError("Slug already in use")
+    db_clinic = Clinic(name=name, slug=slug)
+    db.add(db_clinic)
+    await db.flush()
+    return db_clinic
@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.dashboard_counter import DashboardCounter
+
+# Counters are kept per clinic; the tenant id is part of every key
+def total_patients_key(tenant_id: int) -> str:
+    return f"total_patients:{tenant_id}"
+
+def new_patients_key(tenant_id: int, moment: datetime) -> str:
+    return f"new_patients:{tenant_id}:{moment.year:04d}-{moment.month:02d}"
+
+async def get_counters(db: AsyncSession, keys: Iterable[str]) -> Dict[str, int]:
+    result = await db.execute(
+        select(DashboardCounter.key, DashboardCounter.value)
+        .where(DashboardCounter.key.in_(list(keys)))
+    )
+    return {key: value for key, value in result.all()}
+
+async def get_counter(db: AsyncSession, key: str) -> Tuple[int, Optional[datetime]]:
+    """
+    Return (value, updated_at) of a counter, (0, None) if it was never set.
+    """
+    result = await db.execute(
+        select(DashboardCounter.value, DashboardCounter.updated_at)
+        .where(DashboardCounter.key == key)
+    )
+    row = result.first()
+    return (row[0], row[1]) if row else (0, None)
+
+async def get_all_counters(db: AsyncSession) -> Dict[str, int]:
+    result = await db.execute(select(DashboardCounter.key, DashboardCounter.value))
+    return {key: value for key, value in result.all()}
+
+async def increment(db: AsyncSession, key: str, delta: int = 1) -> None:
+    """
+    Atomically add `delta` to a counter inside the caller's transaction.
+    Does not commit.
+    """
+    dialect = db.get_bind().dialect.name
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    stmt = insert(DashboardCounter).values(
+        key=key, value=delta, updated_at=datetime.utcnow()
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DashboardCounter.key],
+        set_={
+            "value": DashboardCounter.value + stmt.excluded.value,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(stmt)
+
+async def lock_tenant_counters(db: AsyncSession, tenant_id: int) -> None:
+    """
+    Row-lock the clinic's total_patients counter, creating it if missing,
+    until the caller commits. Patient creates and deletes increment it
+    before any other counter or rollup row, so holding it queues just this
+    clinic's counting writes. Does not commit.
+    """
+    await increment(db, total_patients_key(tenant_id), 0)
+
+async def replace_tenant_counters(db: AsyncSession, tenant_id: int, counters: Dict[str, int]) -> None:
+    """
+    Overwrite the clinic's total_patients and new_patients counters with
+    `counters`. Does not commit.
+    """
+    total_key = total_patients_key(tenant_id)
+    result = await db.execute(
+        select(DashboardCounter).where(or_(
+            DashboardCounter.key == total_key,
+            DashboardCounter.key.startswith(f"new_patients:{tenant_id}:", autoescape=True),
+        ))
+    )
+    now = datetime.utcnow()
+    existing = {row.key: row for row in result.scalars().all()}
+    for key, row in existing.items():
+        if key not in counters:
+            await db.delete(row)
+    for key, value in counters.items():
+        if key in existing:
+            existing[key].value = value
+            existing[key].updated_at = now
+        else:
+            db.add(DashboardCounter(key=key, value=value, updated_at=now))
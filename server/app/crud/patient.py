@@ -1,43 +1,572 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from sqlalchemy import (
+    Row, bindparam, delete, func, inspect, literal_column, or_, select, text, tuple_, update
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.core.change_feed import change_feed, patient_event
+from app.core.pagination import encode_cursor, decode_cursor
+from app.crud import dashboard_counter as counter_crud
+from app.crud import patient_rollup as rollup_crud
+from app.models.appointment import Appointment
 from app.models.patient import Patient
 from app.schemas.patient import PatientCreate, PatientUpdate
 
-def get_patient(db: Session, patient_id: int) -> Optional[Patient]:
-    return db.query(Patient).filter(Patient.id == patient_id).first()
+# Every function takes the caller's clinic and only ever sees that clinic's
+# patients; tenant_id comes from the authenticated user, never the client.
+# Queries filter on tenant_id first, matching the (tenant_id, ...) indexes
+# and, when patients is partitioned, pruning to the clinic's partition.
 
-def get_patient_by_email(db: Session, email: str) -> Optional[Patient]:
-    return db.query(Patient).filter(Patient.email == email).first()
+async def get_patient(db: AsyncSession, tenant_id: int, patient_id: int) -> Optional[Patient]:
+    result = await db.execute(
+        select(Patient).where(Patient.tenant_id == tenant_id, Patient.id == patient_id)
+    )
+    return result.scalars().first()
 
-def get_patients(
-    db: Session, skip: int = 0, limit: int = 100
-) -> List[Patient]:
-    return db.query(Patient).offset(skip).limit(limit).all()
+async def get_patient_modified(
+    db: AsyncSession, tenant_id: int, patient_id: int
+) -> Optional[datetime]:
+    """
+    Cheap version probe for conditional requests: the patient's last
+    modification time without loading the row, or None if it does not exist.
+    """
+    result = await db.execute(
+        select(func.coalesce(Patient.updated_at, Patient.created_at))
+        .where(Patient.tenant_id == tenant_id, Patient.id == patient_id)
+    )
+    row = result.first()
+    return row[0] if row else None
 
-def create_patient(db: Session, patient: PatientCreate) -> Patient:
+async def get_patient_by_email(db: AsyncSession, tenant_id: int, email: str) -> Optional[Patient]:
+    result = await db.execute(
+        select(Patient).where(Patient.tenant_id == tenant_id, Patient.email == email)
+    )
+    return result.scalars().first()
+
+# List queries select plain columns and return Row tuples instead of ORM
+# entities: no identity map or instance state, and rows serialize directly.
+# tenant_id is implied by the caller and never returned.
+PATIENT_COLUMNS = [column for column in Patient.__table__.columns if column.name != "tenant_id"]
+PATIENT_FIELDS = [column.name for column in PATIENT_COLUMNS]
+# Last modification time, selected as `_modified` alongside list rows for
+# the page ETag; callers pop it before serializing
+PATIENT_MODIFIED = func.coalesce(Patient.updated_at, Patient.created_at).label("_modified")
+
+def patient_columns(fields: Optional[Sequence[str]] = None, extra: Sequence[str] = ()) -> list:
+    """
+    Column projection for a sparse fieldset: id, any `extra` columns the
+    query itself needs, then the requested fields. None selects every column.
+    """
+    if not fields:
+        return PATIENT_COLUMNS
+    names = dict.fromkeys(["id", *extra, *fields])
+    return [Patient.__table__.c[name] for name in names]
+
+async def get_patient_fields(
+    db: AsyncSession, tenant_id: int, patient_id: int, fields: Sequence[str]
+) -> Optional[Tuple[Dict[str, Any], Optional[datetime]]]:
+    """
+    Load only `fields` of one patient, plus its last-modified time for the ETag.
+    """
+    result = await db.execute(
+        select(
+            *patient_columns(fields),
+            func.coalesce(Patient.updated_at, Patient.created_at).label("_modified"),
+        ).where(Patient.tenant_id == tenant_id, Patient.id == patient_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    values = row._asdict()
+    return values, values.pop("_modified")
+
+async def get_patients(
+    db: AsyncSession,
+    tenant_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+) -> List[Row]:
+    result = await db.execute(
+        select(*patient_columns(fields), PATIENT_MODIFIED)
+        .where(Patient.tenant_id == tenant_id)
+        .order_by(Patient.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    return list(result.all())
+
+# Columns a keyset page can be ordered by; each is paired with id as a tiebreaker
+PATIENT_SORT_KEYS = {
+    "id": Patient.id,
+    "last_name": Patient.last_name,
+    "created_at": Patient.created_at,
+}
+
+async def get_patients_page(
+    db: AsyncSession,
+    tenant_id: int,
+    sort: str = "id",
+    after: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+) -> Tuple[List[Row], Optional[str]]:
+    """
+    Keyset pagination: return up to `limit` patients ordered by (sort, id)
+    that come strictly after the `after` cursor, plus the cursor for the next page.
+    """
+    if sort not in PATIENT_SORT_KEYS:
+        raise ValueError(f"Unsupported sort key: {sort}")
+    column = PATIENT_SORT_KEYS[sort]
+    # The sort key is always selected, the next cursor is built from it
+    query = select(*patient_columns(fields, extra=[sort]), PATIENT_MODIFIED).where(
+        Patient.tenant_id == tenant_id
+    )
+
+    if after:
+        cursor_sort, value, last_id = decode_cursor(after)
+        if cursor_sort != sort:
+            raise ValueError("Cursor does not match sort key")
+        if sort == "id":
+            query = query.where(Patient.id > last_id)
+        else:
+            if not isinstance(value, str):
+                raise ValueError("Invalid cursor")
+            if sort == "created_at":
+                # Raises ValueError for a malformed timestamp
+                value = datetime.fromisoformat(value)
+            query = query.where(tuple_(column, Patient.id) > tuple_(value, last_id))
+
+    if sort == "id":
+        query = query.order_by(Patient.id)
+    else:
+        query = query.order_by(column, Patient.id)
+
+    # Fetch one extra row to know whether another page exists
+    result = await db.execute(query.limit(limit + 1))
+    rows = list(result.all())
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, getattr(last, sort), last.id)
+    return rows, next_cursor
+
+# Search expressions; these must stay identical to the expression indexes
+# created in alembic/versions/add_patient_search_indexes.py
+_EMPTY = literal_column("''")
+SEARCH_DOCUMENT = func.to_tsvector(
+    literal_column("'simple'"),
+    func.coalesce(Patient.first_name, _EMPTY).op("||")(literal_column("' '"))
+    .op("||")(func.coalesce(Patient.last_name, _EMPTY)).op("||")(literal_column("' '"))
+    .op("||")(func.coalesce(Patient.email, _EMPTY)),
+)
+PHONE_DIGITS = func.regexp_replace(
+    func.coalesce(Patient.phone, _EMPTY), literal_column(r"'\D'"), _EMPTY, literal_column("'g'")
+)
+
+def _search_terms(q: str) -> List[str]:
+    return re.findall(r"\w+", q.lower())
+
+async def _search_postgres(
+    db: AsyncSession, tenant_id: int, q: str, terms: List[str], limit: int, columns: list
+) -> List[Row]:
+    needle = q.strip().lower()
+    digits = re.sub(r"\D", "", q)
+    conditions = [
+        func.lower(Patient.first_name).op("%")(needle),
+        func.lower(Patient.last_name).op("%")(needle),
+        func.lower(Patient.email).op("%")(needle),
+    ]
+    rank = [
+        func.similarity(func.lower(Patient.first_name), needle),
+        func.similarity(func.lower(Patient.last_name), needle),
+        func.similarity(func.lower(func.coalesce(Patient.email, "")), needle),
+    ]
+    if terms:
+        # Prefix match on every term, e.g. "jo sm" -> jo:* & sm:*
+        tsquery = func.to_tsquery(
+            literal_column("'simple'"), " & ".join(f"{t}:*" for t in terms)
+        )
+        conditions.append(SEARCH_DOCUMENT.op("@@")(tsquery))
+        rank.append(func.ts_rank(SEARCH_DOCUMENT, tsquery))
+    if len(digits) >= 3:
+        conditions.append(PHONE_DIGITS.like(f"%{digits}%"))
+    score = func.greatest(*rank)
+    result = await db.execute(
+        select(*columns)
+        .where(Patient.tenant_id == tenant_id, or_(*conditions))
+        .order_by(score.desc(), Patient.id)
+        .limit(limit)
+    )
+    return list(result.all())
+
+async def _search_sqlite(
+    db: AsyncSession, tenant_id: int, q: str, terms: List[str], limit: int, columns: list
+) -> List[Row]:
+    # Local fallback: FTS5 prefix matching (no typo tolerance) plus phone fragments
+    scores = {}
+    has_fts = await db.run_sync(
+        lambda session: inspect(session.connection()).has_table("patients_fts")
+    )
+    if terms and has_fts:
+        match = " ".join(f'"{t}"*' for t in terms)
+        rows = await db.execute(
+            text(
+                "SELECT patients_fts.rowid, bm25(patients_fts) FROM patients_fts "
+                "JOIN patients ON patients.id = patients_fts.rowid "
+                "WHERE patients_fts MATCH :match AND patients.tenant_id = :tenant_id "
+                "ORDER BY bm25(patients_fts) LIMIT :limit"
+            ),
+            {"match": match, "tenant_id": tenant_id, "limit": limit},
+        )
+        scores = {row[0]: row[1] for row in rows}
+    elif terms:
+        needle = f"%{q.strip().lower()}%"
+        rows = await db.execute(select(Patient.id).where(Patient.tenant_id == tenant_id, or_(
+            func.lower(Patient.first_name).like(needle),
+            func.lower(Patient.last_name).like(needle),
+            func.lower(Patient.email).like(needle),
+        )).limit(limit))
+        scores = {row[0]: 0.0 for row in rows}
+
+    digits = re.sub(r"\D", "", q)
+    if len(digits) >= 3:
+        phone_digits = func.coalesce(Patient.phone, "")
+        for char in " -()+.":
+            phone_digits = func.replace(phone_digits, char, "")
+        rows = await db.execute(
+            select(Patient.id)
+            .where(Patient.tenant_id == tenant_id, phone_digits.like(f"%{digits}%"))
+            .limit(limit)
+        )
+        for row in rows:
+            scores.setdefault(row[0], 0.0)
+
+    if not scores:
+        return []
+    result = await db.execute(
+        select(*columns).where(Patient.tenant_id == tenant_id, Patient.id.in_(scores))
+    )
+    patients = list(result.all())
+    # bm25 is lower-is-better
+    patients.sort(key=lambda p: (scores[p.id], p.id))
+    return patients[:limit]
+
+async def search_patients(
+    db: AsyncSession,
+    tenant_id: int,
+    q: str,
+    limit: int = 20,
+    fields: Optional[Sequence[str]] = None,
+) -> List[Row]:
+    """
+    Ranked patient search over first_name, last_name, email and phone.
+    Postgres uses the trigram/tsvector indexes for prefix and typo-tolerant
+    matching; SQLite falls back to the patients_fts FTS5 table.
+    """
+    terms = _search_terms(q)
+    columns = patient_columns(fields)
+    if db.get_bind().dialect.name == "postgresql":
+        return await _search_postgres(db, tenant_id, q, terms, limit, columns)
+    return await _search_sqlite(db, tenant_id, q, terms, limit, columns)
+
+async def stream_patient_rows(
+    db: AsyncSession,
+    tenant_id: int,
+    batch_size: int = 1000,
+    fields: Optional[Sequence[str]] = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yield all of the clinic's patients in id order as batches of plain row
+    mappings, read through a server-side cursor so only one batch is in
+    memory at a time.
+    """
+    result = await db.stream(
+        select(*patient_columns(fields))
+        .where(Patient.tenant_id == tenant_id)
+        .order_by(Patient.id)
+        .execution_options(yield_per=batch_size)
+    )
+    async for partition in result.mappings().partitions():
+        yield partition
+
+async def create_patient(db: AsyncSession, tenant_id: int, patient: PatientCreate) -> Patient:
     patient_data = patient.dict()
-    db_patient = Patient(**patient_data)
+    db_patient = Patient(**patient_data, tenant_id=tenant_id)
     db.add(db_patient)
-    db.commit()
-    db.refresh(db_patient)
+    await db.flush()
+    # Dashboard counters change in the same transaction as the row itself
+    await counter_crud.increment(db, counter_crud.total_patients_key(tenant_id))
+    await counter_crud.increment(
+        db, counter_crud.new_patients_key(tenant_id, db_patient.created_at)
+    )
+    await rollup_crud.increment(db, tenant_id, db_patient.created_at.date())
+    await change_feed.publish(
+        db, patient_event(tenant_id, "patient.created", [db_patient.id], db_patient)
+    )
+    await db.commit()
+    await db.refresh(db_patient)
     return db_patient
 
-def update_patient(
-    db: Session, patient_id: int, patient: PatientUpdate
-) -> Optional[Patient]:
-    db_patient = get_patient(db, patient_id)
-    if db_patient:
-        update_data = patient.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_patient, field, value)
-        db.commit()
-        db.refresh(db_patient)
-    return db_patient
+# Postgres allows 32767 bind parameters per statement, SQLite builds before 3.32 only 999
+MAX_BIND_PARAMS = {"postgresql": 32000, "sqlite": 999}
+
+# Columns an import row may supply; inserts fill the rest with NULL and
+# last_visit with the import time
+IMPORT_FIELDS = list(PatientCreate.model_fields)
+
+async def bulk_insert_patients(
+    db: AsyncSession, tenant_id: int, rows: List[Dict], on_conflict: str = "skip"
+) -> Tuple[int, int, Set[str]]:
+    """
+    Insert many validated patient dicts into the clinic with multi-row
+    INSERT ... ON CONFLICT (tenant_id, email) in a single transaction.
+    `on_conflict` is "skip" (keep the existing row) or "update" (overwrite
+    the columns each row supplies; the others, and last_visit, are kept).
+    Returns (inserted, updated, conflicting emails).
+    """
+    if not rows:
+        return 0, 0, set()
+    dialect = db.get_bind().dialect.name
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    now = datetime.utcnow()
+
+    emails = [row["email"] for row in rows if row.get("email")]
+    existing: Dict[str, int] = {}
+    if emails:
+        result = await db.execute(
+            select(Patient.email, Patient.id)
+            .where(Patient.tenant_id == tenant_id, Patient.email.in_(emails))
+        )
+        existing = {email: patient_id for email, patient_id in result.all()}
+    existing_ids = set(existing.values())
+
+    # One statement per set of supplied columns, so an update never
+    # overwrites a column the upload left out
+    shapes: Dict[Tuple[str, ...], List[Dict]] = {}
+    for row in rows:
+        shapes.setdefault(tuple(sorted(row)), []).append(row)
+
+    inserted_ids: List[int] = []
+    updated_ids: List[int] = []
+    for supplied, group in shapes.items():
+        values = [
+            {
+                **dict.fromkeys(IMPORT_FIELDS),
+                "last_visit": now,
+                **row,
+                "tenant_id": tenant_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for row in group
+        ]
+        chunk_size = max(1, MAX_BIND_PARAMS.get(dialect, 999) // len(values[0]))
+        for start in range(0, len(values), chunk_size):
+            stmt = insert(Patient).values(values[start:start + chunk_size])
+            if on_conflict == "update":
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Patient.tenant_id, Patient.email],
+                    set_={
+                        **{
+                            column: stmt.excluded[column]
+                            for column in supplied if column not in ("email", "last_visit")
+                        },
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=[Patient.tenant_id, Patient.email])
+            if dialect == "postgresql":
+                # xmax is 0 for a freshly inserted row, also catching rows
+                # committed by others after the existence check
+                stmt = stmt.returning(Patient.id, literal_column("xmax = 0").label("inserted"))
+            else:
+                stmt = stmt.returning(Patient.id)
+            for row in (await db.execute(stmt)).all():
+                fresh = row.inserted if dialect == "postgresql" else row.id not in existing_ids
+                (inserted_ids if fresh else updated_ids).append(row.id)
+
+    inserted = len(inserted_ids)
+    if inserted:
+        await counter_crud.increment(db, counter_crud.total_patients_key(tenant_id), inserted)
+        await counter_crud.increment(db, counter_crud.new_patients_key(tenant_id, now), inserted)
+        await rollup_crud.increment(db, tenant_id, now.date(), inserted)
+    if inserted_ids:
+        await change_feed.publish(db, patient_event(tenant_id, "patient.created", inserted_ids))
+    if updated_ids:
+        await change_feed.publish(db, patient_event(tenant_id, "patient.updated", updated_ids))
+    await db.commit()
+    return inserted, len(updated_ids), set(existing)
+
+async def update_patient(
+    db: AsyncSession,
+    tenant_id: int,
+    patient_id: int,
+    patient: PatientUpdate,
+    expected_versions: Optional[List[datetime]] = None,
+) -> Optional[Row]:
+    """
+    Apply the update with a single UPDATE ... RETURNING and commit straight
+    after it, so the row stays locked only for the change notification and
+    the commit. With `expected_versions` (modification times from
+    If-Match) the row is only updated if it still has one of them.
+    Returns the updated row, or None if nothing matched.
+    """
+    stmt = (
+        update(Patient)
+        .where(Patient.tenant_id == tenant_id, Patient.id == patient_id)
+        .values(**patient.dict(exclude_unset=True), updated_at=datetime.utcnow())
+        .returning(*PATIENT_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+    if expected_versions is not None:
+        stmt = stmt.where(
+            func.coalesce(Patient.updated_at, Patient.created_at).in_(expected_versions)
+        )
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        return None
+    await change_feed.publish(db, patient_event(tenant_id, "patient.updated", [row.id], row))
+    await db.commit()
+    return row
+
+async def bulk_update_patients(
+    db: AsyncSession, tenant_id: int, changes: List[Dict[str, Any]]
+) -> Tuple[List[int], List[int]]:
+    """
+    Apply many partial updates (dicts of `id` plus the columns to change) in
+    one transaction. The rows are locked in id order up front so concurrent
+    bulk edits cannot deadlock; changes sharing the same columns go out as
+    one executemany. Returns (updated ids, ids that do not exist).
+    """
+    ids = sorted({change["id"] for change in changes})
+    query = (
+        select(Patient.id)
+        .where(Patient.tenant_id == tenant_id, Patient.id.in_(ids))
+        .order_by(Patient.id)
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        query = query.with_for_update()
+    found = set((await db.execute(query)).scalars().all())
+
+    now = datetime.utcnow()
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for change in changes:
+        if change["id"] not in found:
+            continue
+        values = {key: value for key, value in change.items() if key != "id"}
+        values["updated_at"] = now
+        groups.setdefault(tuple(sorted(values)), []).append({"_id": change["id"], **values})
+
+    table = Patient.__table__
+    for params in groups.values():
+        # The SET clause is taken from the parameter keys
+        await db.execute(
+            table.update().where(table.c.tenant_id == tenant_id, table.c.id == bindparam("_id")),
+            params,
+        )
+    if found:
+        await change_feed.publish(db, patient_event(tenant_id, "patient.updated", sorted(found)))
+    await db.commit()
+    return sorted(found), [patient_id for patient_id in ids if patient_id not in found]
+
+async def _record_deletions(
+    db: AsyncSession, tenant_id: int, created: Iterable[Optional[datetime]]
+) -> None:
+    created = list(created)
+    await counter_crud.increment(db, counter_crud.total_patients_key(tenant_id), -len(created))
+    months = Counter(
+        counter_crud.new_patients_key(tenant_id, moment) for moment in created if moment
+    )
+    for key, count in months.items():
+        await counter_crud.increment(db, key, -count)
+    days = Counter(moment.date() for moment in created if moment)
+    for day, count in days.items():
+        await rollup_crud.increment(db, tenant_id, day, -count)
+
+async def delete_patient(db: AsyncSession, tenant_id: int, patient_id: int) -> bool:
+    result = await db.execute(
+        delete(Patient)
+        .where(Patient.tenant_id == tenant_id, Patient.id == patient_id)
+        .returning(Patient.created_at)
+    )
+    row = result.first()
+    if row is None:
+        return False
+    await _record_deletions(db, tenant_id, [row.created_at])
+    await change_feed.publish(db, patient_event(tenant_id, "patient.deleted", [patient_id]))
+    await db.commit()
+    return True
+
+async def bulk_delete_patients(db: AsyncSession, tenant_id: int, ids: List[int]) -> List[int]:
+    """
+    Delete many patients with one DELETE ... RETURNING; returns the ids deleted.
+    """
+    result = await db.execute(
+        delete(Patient)
+        .where(Patient.tenant_id == tenant_id, Patient.id.in_(ids))
+        .returning(Patient.id, Patient.created_at)
+    )
+    rows = result.all()
+    if rows:
+        await _record_deletions(db, tenant_id, [row.created_at for row in rows])
+        await change_feed.publish(
+            db, patient_event(tenant_id, "patient.deleted", sorted(row.id for row in rows))
+        )
+    await db.commit()
+    return sorted(row.id for row in rows)
+
+# Contact columns a merge copies from the removed patient when the kept one has none
+MERGE_FILL_FIELDS = ["email", "phone", "address", "medical_history"]
+
+async def merge_patients(
+    db: AsyncSession, tenant_id: int, keep_id: int, remove_id: int
+) -> Optional[Row]:
+    """
+    Merge `remove_id` into `keep_id` in one transaction: its appointments
+    move over, contact fields the kept patient lacks are copied, and it is
+    deleted. Returns the kept patient, or None if either does not exist.
+    """
+    query = select(*PATIENT_COLUMNS).where(
+        Patient.tenant_id == tenant_id, Patient.id.in_([keep_id, remove_id])
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        query = query.order_by(Patient.id).with_for_update()
+    rows = {row.id: row for row in (await db.execute(query)).all()}
+    if keep_id == remove_id or len(rows) != 2:
+        return None
+    kept, removed = rows[keep_id], rows[remove_id]
+
+    await db.execute(
+        update(Appointment)
+        .where(Appointment.tenant_id == tenant_id, Appointment.patient_id == remove_id)
+        .values(patient_id=keep_id, updated_at=datetime.utcnow())
+    )
+    # Deleted first, so its email is free for the kept patient
+    await db.execute(
+        delete(Patient).where(Patient.tenant_id == tenant_id, Patient.id == remove_id)
+    )
+    await _record_deletions(db, tenant_id, [removed.created_at])
+    fill = {
+        field: getattr(removed, field)
+        for field in MERGE_FILL_FIELDS
+        if getattr(kept, field) is None and getattr(removed, field) is not None
+    }
+    row = (await db.execute(
+        update(Patient)
+        .where(Patient.tenant_id == tenant_id, Patient.id == keep_id)
+        .values(**fill, updated_at=datetime.utcnow())
+        .returning(*PATIENT_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )).first()
+    await change_feed.publish(db, patient_event(tenant_id, "patient.deleted", [remove_id]))
+    await change_feed.publish(db, patient_event(tenant_id, "patient.updated", [keep_id], row))
+    await db.commit()
+    return row
 
-def delete_patient(db: Session, patient_id: int) -> bool:
-    db_patient = get_patient(db, patient_id)
-    if db_patient:
-        db.delete(db_patient)
-        db.commit()
-        return True
-    return False 
\ No newline at end of file
@@ -0,0 +1,109 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import Row, delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from app.models.patient import Patient
+from app.models.patient_duplicate import PatientDuplicate
+
+# Patient columns shown side by side in the review queue, besides the ids
+REVIEW_FIELDS = ["first_name", "last_name", "date_of_birth", "email", "phone"]
+
+async def store_suggestions(
+    db: AsyncSession,
+    tenant_id: int,
+    suggestions: List[Dict],
+    run_started: datetime,
+    batch_size: int = 1000,
+) -> None:
+    """
+    Upsert the suggestions of a clinic's dedupe run by (patient_id,
+    duplicate_id), keeping the status of pairs already reviewed, then drop
+    the clinic's pending suggestions the run did not find again.
+    """
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    now = datetime.utcnow()
+    for start in range(0, len(suggestions), batch_size):
+        stmt = insert(PatientDuplicate).values([
+            {
+                **suggestion,
+                "tenant_id": tenant_id,
+                "status": "pending",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for suggestion in suggestions[start:start + batch_size]
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PatientDuplicate.patient_id, PatientDuplicate.duplicate_id],
+            set_={
+                "score": stmt.excluded.score,
+                "reasons": stmt.excluded.reasons,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await db.execute(stmt)
+    await db.execute(
+        delete(PatientDuplicate).where(
+            PatientDuplicate.tenant_id == tenant_id,
+            PatientDuplicate.status == "pending",
+            PatientDuplicate.updated_at < run_started,
+        )
+    )
+    await db.commit()
+
+def _review_query(tenant_id: int):
+    patient = aliased(Patient)
+    duplicate = aliased(Patient)
+    return (
+        select(
+            *PatientDuplicate.__table__.columns,
+            *(getattr(patient, name).label(f"patient_{name}") for name in REVIEW_FIELDS),
+            *(getattr(duplicate, name).label(f"duplicate_{name}") for name in REVIEW_FIELDS),
+        )
+        .join(
+            patient,
+            (patient.tenant_id == PatientDuplicate.tenant_id)
+            & (patient.id == PatientDuplicate.patient_id),
+        )
+        .join(
+            duplicate,
+            (duplicate.tenant_id == PatientDuplicate.tenant_id)
+            & (duplicate.id == PatientDuplicate.duplicate_id),
+        )
+        .where(PatientDuplicate.tenant_id == tenant_id)
+    )
+
+async def get_suggestions(
+    db: AsyncSession, tenant_id: int, status: str = "pending", skip: int = 0, limit: int = 100
+) -> List[Row]:
+    """
+    The clinic's suggestions with the given status, most likely duplicates
+    first, each with both patients' review columns. Served by
+    (tenant_id, status, score).
+    """
+    result = await db.execute(
+        _review_query(tenant_id)
+        .where(PatientDuplicate.status == status)
+        .order_by(PatientDuplicate.score.desc(), PatientDuplicate.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    return list(result.all())
+
+async def get_suggestion(db: AsyncSession, tenant_id: int, suggestion_id: int) -> Optional[Row]:
+    result = await db.execute(
+        _review_query(tenant_id).where(PatientDuplicate.id == suggestion_id)
+    )
+    return result.first()
+
+async def set_status(db: AsyncSession, tenant_id: int, suggestion_id: int, status: str) -> bool:
+    result = await db.execute(
+        update(PatientDuplicate)
+        .where(PatientDuplicate.tenant_id == tenant_id, PatientDuplicate.id == suggestion_id)
+        .values(status=status, updated_at=datetime.utcnow())
+    )
+    await db.commit()
+    return result.rowcount > 0
@@ -0,0 +1,76 @@
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.patient_daily_rollup import PatientDailyRollup
+
+async def increment(db: AsyncSession, tenant_id: int, day: date, delta: int = 1) -> None:
+    """
+    Atomically add `delta` to a clinic's new-patient count for a day inside
+    the caller's transaction. Does not commit.
+    """
+    dialect = db.get_bind().dialect.name
+    insert = pg_insert if dialect == "postgresql" else sqlite_insert
+    stmt = insert(PatientDailyRollup).values(
+        tenant_id=tenant_id, day=day, new_patients=delta, updated_at=datetime.utcnow()
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PatientDailyRollup.tenant_id, PatientDailyRollup.day],
+        set_={
+            "new_patients": PatientDailyRollup.new_patients + stmt.excluded.new_patients,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(stmt)
+
+async def get_days(
+    db: AsyncSession, tenant_id: int, start: date, end: date
+) -> List[Tuple[date, int]]:
+    """
+    (day, new patients) for the clinic's days in [start, end] that have any.
+    """
+    result = await db.execute(
+        select(PatientDailyRollup.day, PatientDailyRollup.new_patients)
+        .where(
+            PatientDailyRollup.tenant_id == tenant_id,
+            PatientDailyRollup.day >= start,
+            PatientDailyRollup.day <= end,
+        )
+        .order_by(PatientDailyRollup.day)
+    )
+    return [(day, count) for day, count in result.all()]
+
+async def total_before(db: AsyncSession, tenant_id: int, day: date) -> int:
+    return await db.scalar(
+        select(func.coalesce(func.sum(PatientDailyRollup.new_patients), 0))
+        .where(PatientDailyRollup.tenant_id == tenant_id, PatientDailyRollup.day < day)
+    )
+
+async def replace_range(
+    db: AsyncSession,
+    tenant_id: int,
+    counts: Dict[date, int],
+    start: Optional[date],
+    end: Optional[date],
+) -> None:
+    """
+    Replace the clinic's rollup rows in [start, end] (open-ended when None)
+    with `counts`, keyed by day. Does not commit.
+    """
+    stmt = delete(PatientDailyRollup).where(PatientDailyRollup.tenant_id == tenant_id)
+    if start is not None:
+        stmt = stmt.where(PatientDailyRollup.day >= start)
+    if end is not None:
+        stmt = stmt.where(PatientDailyRollup.day <= end)
+    await db.execute(stmt)
+    now = datetime.utcnow()
+    if counts:
+        await db.execute(
+            PatientDailyRollup.__table__.insert(),
+            [
+                {"tenant_id": tenant_id, "day": day, "new_patients": count, "updated_at": now}
+                for day, count in sorted(counts.items())
+            ],
+        )
@@ -1,33 +1,74 @@
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate
-from app.core.password import verify_password, get_password_hash
+from app.services.password_hasher import password_hasher
+from app.core.change_feed import change_feed
+from app.core.principal_cache import principal_cache
 
-def get_user(db: Session, user_id: int):
-    return db.query(User).filter(User.id == user_id).first()
+async def get_user(db: AsyncSession, user_id: int):
+    result = await db.execute(select(User).where(User.id == user_id))
+    return result.scalars().first()
 
-def get_user_by_email(db: Session, email: str):
-    return db.query(User).filter(User.email == email).first()
+async def get_user_by_email(db: AsyncSession, email: str):
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalars().first()
 
-def get_users(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(User).offset(skip).limit(limit).all()
+async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100):
+    result = await db.execute(select(User).offset(skip).limit(limit))
+    return list(result.scalars().all())
 
-def create_user(db: Session, user: UserCreate):
-    hashed_password = get_password_hash(user.password)
+async def create_user(db: AsyncSession, user: UserCreate, tenant_id: Optional[int] = None):
+    hashed_password = await password_hasher.hash(user.password)
     db_user = User(
         email=user.email,
         hashed_password=hashed_password,
-        full_name=user.full_name
+        name=user.name,
+        tenant_id=settings.DEFAULT_TENANT_ID if tenant_id is None else tenant_id,
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
-def authenticate_user(db: Session, email: str, password: str):
-    user = get_user_by_email(db, email)
+async def update_user(db: AsyncSession, user_id: int, update_data: dict):
+    db_user = await get_user(db, user_id)
+    if db_user:
+        old_email = db_user.email
+        if "password" in update_data:
+            update_data["hashed_password"] = await password_hasher.hash(
+                update_data.pop("password")
+            )
+        for field, value in update_data.items():
+            setattr(db_user, field, value)
+        # Cached principals are keyed by email, drop both old and new keys
+        subjects = {old_email, db_user.email}
+        await change_feed.invalidate_principals(db, subjects)
+        await db.commit()
+        await db.refresh(db_user)
+        for subject in subjects:
+            principal_cache.invalidate(subject)
+    return db_user
+
+async def deactivate_user(db: AsyncSession, user_id: int):
+    return await update_user(db, user_id, {"is_active": False})
+
+async def delete_user(db: AsyncSession, user_id: int) -> bool:
+    db_user = await get_user(db, user_id)
+    if db_user:
+        await db.delete(db_user)
+        await change_feed.invalidate_principals(db, [db_user.email])
+        await db.commit()
+        principal_cache.invalidate(db_user.email)
+        return True
+    return False
+
+async def authenticate_user(db: AsyncSession, email: str, password: str):
+    user = await get_user_by_email(db, email)
     if not user:
         return False
-    if not verify_password(password, user.hashed_password):
+    if not await password_hasher.verify(password, user.hashed_password):
         return False
-    return user 
\ No newline at end of file
+    return user
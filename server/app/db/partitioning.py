@@ -0,0 +1,120 @@
+"""
+Optional Postgres partitioning of the patients table by clinic (tenant_id).
+
+Every patient query filters on tenant_id, so with a partitioned table the
+planner only touches the clinic's own partition: its indexes stay small,
+and a large clinic's vacuum or bulk import never scans another's rows.
+LIST gives each clinic its own partition (new clinics get one from the
+create-clinic command, anything else lands in patients_default); HASH
+spreads clinics over a fixed number of partitions, for many small clinics.
+
+The conversion rewrites the whole table under an exclusive lock, so run it
+in a maintenance window: `python -m app.cli partition-patients --by list`.
+"""
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud import clinic as clinic_crud
+
+# Foreign keys into patients, dropped while the table is replaced
+PATIENT_FOREIGN_KEYS = [
+    ("appointments", "fk_appointments_patient", "tenant_id, patient_id"),
+    ("patient_duplicates", "fk_patient_duplicates_patient", "tenant_id, patient_id"),
+    ("patient_duplicates", "fk_patient_duplicates_duplicate", "tenant_id, duplicate_id"),
+]
+STRATEGIES = {"l": "list", "h": "hash"}
+
+def partition_name(tenant_id: int) -> str:
+    return f"patients_clinic_{int(tenant_id)}"
+
+async def partition_strategy(db: AsyncSession) -> Optional[str]:
+    """
+    "list" or "hash" if patients is partitioned, otherwise None.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    strategy = await db.scalar(text(
+        "SELECT partstrat FROM pg_partitioned_table "
+        "WHERE partrelid = to_regclass('patients')"
+    ))
+    return STRATEGIES.get(strategy)
+
+async def create_clinic_partition(db: AsyncSession, tenant_id: int) -> str:
+    """
+    Give a clinic its own partition of a LIST-partitioned patients table.
+    Does not commit.
+    """
+    name = partition_name(tenant_id)
+    await db.execute(text(
+        f"CREATE TABLE {name} PARTITION OF patients FOR VALUES IN ({int(tenant_id)})"
+    ))
+    return name
+
+async def partition_patients(db: AsyncSession, strategy: str, partitions: int = 8) -> List[str]:
+    """
+    Replace patients with a table partitioned by tenant_id, copying every
+    row and recreating its indexes and the foreign keys pointing at it, in
+    one transaction. Returns the partitions created.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        raise ValueError("Partitioning needs PostgreSQL")
+    if strategy not in STRATEGIES.values():
+        raise ValueError("Strategy must be list or hash")
+    if strategy == "hash" and partitions < 1:
+        raise ValueError("At least one partition is needed")
+    if await partition_strategy(db) is not None:
+        raise ValueError("patients is already partitioned")
+
+    await db.execute(text("LOCK TABLE patients IN ACCESS EXCLUSIVE MODE"))
+    # Index names are unique per schema, so they are recreated from their
+    # definitions once the old table and its indexes are gone
+    indexes = (await db.execute(text(
+        "SELECT indexname, indexdef FROM pg_indexes "
+        "WHERE schemaname = current_schema() AND tablename = 'patients'"
+    ))).all()
+    for table, constraint, _ in PATIENT_FOREIGN_KEYS:
+        await db.execute(text(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {constraint}"))
+    await db.execute(text("ALTER TABLE patients RENAME TO patients_unpartitioned"))
+    await db.execute(text(
+        "CREATE TABLE patients (LIKE patients_unpartitioned INCLUDING DEFAULTS) "
+        f"PARTITION BY {strategy.upper()} (tenant_id)"
+    ))
+
+    created = []
+    if strategy == "list":
+        for clinic in await clinic_crud.get_clinics(db):
+            created.append(await create_clinic_partition(db, clinic.id))
+        await db.execute(text("CREATE TABLE patients_default PARTITION OF patients DEFAULT"))
+        created.append("patients_default")
+    else:
+        for remainder in range(partitions):
+            name = f"patients_p{remainder}"
+            await db.execute(text(
+                f"CREATE TABLE {name} PARTITION OF patients "
+                f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+            ))
+            created.append(name)
+
+    await db.execute(text("INSERT INTO patients SELECT * FROM patients_unpartitioned"))
+    # The id sequence belongs to the old table and would be dropped with it
+    await db.execute(text("ALTER SEQUENCE patients_id_seq OWNED BY patients.id"))
+    await db.execute(text("DROP TABLE patients_unpartitioned"))
+
+    # A partitioned table's primary key must include the partition key
+    await db.execute(text("ALTER TABLE patients ADD PRIMARY KEY (tenant_id, id)"))
+    await db.execute(text(
+        "ALTER TABLE patients ADD CONSTRAINT patients_tenant_id_fkey "
+        "FOREIGN KEY (tenant_id) REFERENCES clinics (id)"
+    ))
+    for name, definition in indexes:
+        if name != "patients_pkey":
+            await db.execute(text(definition))
+    for table, constraint, columns in PATIENT_FOREIGN_KEYS:
+        await db.execute(text(
+            f"ALTER TABLE {table} ADD CONSTRAINT {constraint} FOREIGN KEY ({columns}) "
+            "REFERENCES patients (tenant_id, id) ON DELETE CASCADE"
+        ))
+    await db.commit()
+    await db.execute(text("ANALYZE patients"))
+    await db.commit()
+    return created
@@ -0,0 +1,67 @@
+import time
+from collections import OrderedDict
+from http.cookies import SimpleCookie
+from typing import Optional
+from app.core.config import settings
+
+# Cookie carrying the end of the read-your-writes window, as a Unix time,
+# so the window holds even when the next request reaches another worker
+READ_YOUR_WRITES_COOKIE = "rw_until"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+class ReadYourWrites:
+    """
+    Remembers which users wrote recently, so their reads can be kept on the
+    primary until replicas have caught up with their own changes.
+    """
+
+    def __init__(self, window: float, max_size: int = 10000):
+        self.window = window
+        self.max_size = max_size
+        self._until: "OrderedDict[str, float]" = OrderedDict()
+
+    def mark(self, key: str) -> float:
+        until = time.time() + self.window
+        self._until[key] = until
+        self._until.move_to_end(key)
+        while len(self._until) > self.max_size:
+            self._until.popitem(last=False)
+        return until
+
+    def active(self, key: Optional[str], cookie: Optional[str] = None) -> bool:
+        now = time.time()
+        if key is not None and self._until.get(key, 0) > now:
+            return True
+        try:
+            return cookie is not None and float(cookie) > now
+        except ValueError:
+            return False
+
+# Create a singleton instance
+read_your_writes = ReadYourWrites(window=settings.READ_YOUR_WRITES_SECONDS)
+
+class ReadYourWritesMiddleware:
+    """
+    Sets the read-your-writes cookie on every successful write request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            return await self.app(scope, receive, send)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = SimpleCookie()
+                cookie[READ_YOUR_WRITES_COOKIE] = f"{time.time() + read_your_writes.window:.3f}"
+                cookie[READ_YOUR_WRITES_COOKIE]["max-age"] = int(read_your_writes.window) + 1
+                cookie[READ_YOUR_WRITES_COOKIE]["path"] = "/"
+                cookie[READ_YOUR_WRITES_COOKIE]["httponly"] = True
+                cookie[READ_YOUR_WRITES_COOKIE]["samesite"] = "Lax"
+                header = cookie[READ_YOUR_WRITES_COOKIE].OutputString().encode("latin-1")
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", header)]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
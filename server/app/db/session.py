@@ -1,40 +1,126 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+import asyncio
+import itertools
+from typing import AsyncGenerator, Iterator, List, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from app.core.config import settings
-import time
+from app.core.metrics import TimedQueuePool, instrument_engine
 
-def get_db_engine():
-    max_retries = 5
-    retry_interval = 5
-    
-    for attempt in range(max_retries):
+# Async drivers used in place of the sync ones in DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def get_async_database_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+def get_db_engine(database_url: Optional[str] = None):
+    database_url = database_url or settings.DATABASE_URL
+    # Ensure DATABASE_URL is not None
+    if not database_url:
+        raise ValueError("DATABASE_URL is not set")
+
+    url = get_async_database_url(database_url)
+    if url.startswith("sqlite"):
+        return create_async_engine(url)
+    return create_async_engine(
+        url,
+        poolclass=TimedQueuePool,
+        pool_pre_ping=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW
+    )
+
+class LazySessionmaker(async_sessionmaker):
+    """
+    Session factory that creates the engine on first use, so importing the
+    app (or a CLI command) never touches the database.
+    """
+
+    def __call__(self, **kw) -> AsyncSession:
+        get_engine()
+        return super().__call__(**kw)
+
+_engine: Optional[AsyncEngine] = None
+_replica_engines: Optional[List[AsyncEngine]] = None
+_replica_cycle: Optional[Iterator[AsyncEngine]] = None
+SessionLocal = LazySessionmaker(autoflush=False, expire_on_commit=False)
+
+def get_engine() -> AsyncEngine:
+    global _engine
+    if _engine is None:
+        _engine = get_db_engine()
+        instrument_engine(_engine)
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
+def get_replica_engines() -> List[AsyncEngine]:
+    global _replica_engines, _replica_cycle
+    if _replica_engines is None:
+        urls = [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+        _replica_engines = []
+        for url in urls:
+            replica = get_db_engine(url)
+            instrument_engine(replica, pool_metrics=False)
+            _replica_engines.append(replica)
+        _replica_cycle = itertools.cycle(_replica_engines)
+    return _replica_engines
+
+def get_read_engine() -> AsyncEngine:
+    """
+    Engine for read-only work: the replicas in turn, or the primary when
+    no DATABASE_REPLICA_URLS are configured.
+    """
+    if not get_replica_engines():
+        return get_engine()
+    return next(_replica_cycle)
+
+def ReplicaSessionLocal() -> AsyncSession:
+    return SessionLocal(bind=get_read_engine())
+
+async def dispose_engine() -> None:
+    global _engine, _replica_engines
+    for replica in _replica_engines or []:
+        await replica.dispose()
+    _replica_engines = None
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+
+async def ping(timeout: float) -> None:
+    async def select_one():
+        async with get_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    await asyncio.wait_for(select_one(), timeout=timeout)
+
+async def warm_pool(timeout: float) -> None:
+    """
+    Open the pool's connections concurrently (one round trip of latency
+    instead of pool_size) so the first requests do not pay for connecting.
+    """
+    pool = get_engine().pool
+    connections = pool.size() if hasattr(pool, "size") else 1
+    await asyncio.gather(*(ping(timeout) for _ in range(connections)))
+
+async def wait_for_db(retry_interval: float = 1, max_interval: float = 30) -> None:
+    """
+    Retry warming the pool, with capped exponential backoff, until the
+    database answers. Meant to run as a background task.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
         try:
-            # Ensure DATABASE_URL is not None
-            if not settings.DATABASE_URL:
-                raise ValueError("DATABASE_URL is not set")
-                
-            engine = create_engine(
-                settings.DATABASE_URL,
-                pool_pre_ping=True,
-                pool_size=5,
-                max_overflow=10
-            )
-            # Test the connection using text()
-            with engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-            return engine
+            await warm_pool(timeout=settings.DB_CONNECT_TIMEOUT_SECONDS)
+            return
         except Exception as e:
-            if attempt == max_retries - 1:
-                raise e
-            print(f"Database connection attempt {attempt + 1} failed. Retrying in {retry_interval} seconds...")
-            time.sleep(retry_interval)
-
-engine = get_db_engine()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            delay = min(retry_interval * 2 ** (attempt - 1), max_interval)
+            print(f"Database connection attempt {attempt} failed ({e!r}). Retrying in {delay:g} seconds...")
+            await asyncio.sleep(delay)
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close() 
\ No newline at end of file
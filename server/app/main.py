@@ -1,26 +1,84 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST
+from app.core.admission import AdmissionControlMiddleware
+from app.core.change_feed import change_feed
 from app.core.config import settings
-from app.api.v1.endpoints import chatbot, patients, dashboard, auth
-
-app = FastAPI(
-    title=settings.PROJECT_NAME,
-    version=settings.VERSION,
+from app.core.metrics import MetricsMiddleware, render_metrics
+from app.api.v1.endpoints import (
+    appointments, changes, chatbot, duplicates, patients, dashboard, auth, health
 )
+from app.db.routing import ReadYourWritesMiddleware
+from app.db.session import SessionLocal, dispose_engine, get_engine, wait_for_db
+from app.services.dashboard_stats import run_periodic_rebuild
+from app.services.password_hasher import password_hasher
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["*"],
-    max_age=3600,
-)
+async def connect_database(app: FastAPI) -> None:
+    await wait_for_db()
+    app.state.db_ready = True
+    print("Database connection pool ready")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup never waits for the database: the connection is retried in the
+    # background and /health/ready reports 503 until it succeeds
+    get_engine()
+    app.state.db_ready = False
+    app.state.db_connect_task = asyncio.create_task(connect_database(app))
+    app.state.stats_rebuild_task = asyncio.create_task(run_periodic_rebuild(SessionLocal))
+    change_feed.start()
+    try:
+        yield
+    finally:
+        app.state.db_connect_task.cancel()
+        app.state.stats_rebuild_task.cancel()
+        await change_feed.stop()
+        password_hasher.shutdown()
+        await dispose_engine()
+
+def create_app() -> FastAPI:
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        version=settings.VERSION,
+        lifespan=lifespan,
+    )
+
+    # Innermost, so 503s from load shedding still carry CORS headers
+    app.add_middleware(AdmissionControlMiddleware)
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["*"],
+        max_age=3600,
+    )
+    if settings.DATABASE_REPLICA_URLS:
+        app.add_middleware(ReadYourWritesMiddleware)
+    # Outermost, so latency includes CORS handling
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        """
+        Prometheus scrape endpoint.
+        """
+        return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+    # Include routers
+    app.include_router(health.router, prefix="/health", tags=["health"])
+    app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
+    # Before the patients router, whose /{patient_id} would otherwise match
+    app.include_router(duplicates.router, prefix="/api/v1/patients/duplicates", tags=["patients"])
+    app.include_router(patients.router, prefix="/api/v1/patients", tags=["patients"])
+    app.include_router(appointments.router, prefix="/api/v1/appointments", tags=["appointments"])
+    app.include_router(chatbot.router, prefix="/api/v1/chatbot", tags=["chatbot"])
+    app.include_router(dashboard.router, prefix="/api/v1/dashboard", tags=["dashboard"])
+    app.include_router(changes.router, prefix="/api/v1/changes", tags=["changes"])
+    return app
 
-# Include routers
-app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
-app.include_router(patients.router, prefix="/api/v1/patients", tags=["patients"])
-app.include_router(chatbot.router, prefix="/api/v1/chatbot", tags=["chatbot"])
-app.include_router(dashboard.router, prefix="/api/v1/dashboard", tags=["dashboard"]) 
\ No newline at end of file
+app = create_app()
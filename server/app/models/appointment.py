@@ -0,0 +1,35 @@
+from sqlalchemy import (
+    Column, DateTime, ForeignKey, ForeignKeyConstraint, Index, Integer, String, Text
+)
+from app.db.base_class import Base
+from datetime import datetime
+
+class Appointment(Base):
+    __tablename__ = "appointments"
+    __table_args__ = (
+        # Provider calendars and the slot-conflict check
+        Index("ix_appointments_provider_id_start_time", "provider_id", "start_time"),
+        # A patient's appointment history
+        Index("ix_appointments_patient_id_start_time", "patient_id", "start_time"),
+        # Clinic-wide day/week views and the dashboard count; status is
+        # included so counting active appointments needs no table access
+        Index("ix_appointments_tenant_id_start_time_status", "tenant_id", "start_time", "status"),
+        # Includes tenant_id, so a patient of another clinic cannot be referenced
+        ForeignKeyConstraint(
+            ["tenant_id", "patient_id"], ["patients.tenant_id", "patients.id"],
+            name="fk_appointments_patient", ondelete="CASCADE",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    tenant_id = Column(Integer, ForeignKey("clinics.id"), nullable=False)
+    patient_id = Column(Integer, nullable=False)
+    # The dentist or hygienist, one of the clinic's users
+    provider_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    start_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
+    status = Column(String, nullable=False, default="scheduled")
+    reason = Column(String)
+    notes = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
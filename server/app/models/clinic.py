@@ -0,0 +1,14 @@
+from sqlalchemy import Column, DateTime, Integer, String
+from app.db.base_class import Base
+from datetime import datetime
+
+class Clinic(Base):
+    """
+    A tenant: every user and patient belongs to exactly one clinic.
+    """
+    __tablename__ = "clinics"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    slug = Column(String, unique=True, index=True, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,11 @@
+from sqlalchemy import BigInteger, Column, DateTime, String
+from app.db.base_class import Base
+from datetime import datetime
+
+class DashboardCounter(Base):
+    __tablename__ = "dashboard_counters"
+
+    # Per clinic, e.g. "total_patients:1" or "new_patients:1:2024-03"
+    key = Column(String, primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,19 +1,33 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
+# Registers the clinics table that tenant_id refers to
+from app.models.clinic import Clinic  # noqa: F401
 from datetime import datetime
 
 class Patient(Base):
     __tablename__ = "patients"
+    # Every query is scoped to one clinic, so the indexes lead with tenant_id
+    __table_args__ = (
+        # Target of the (tenant_id, patient_id) foreign keys, and lookups by id
+        Index("ix_patients_tenant_id_id", "tenant_id", "id", unique=True),
+        # Emails are unique within a clinic; the same person may attend two
+        Index("ix_patients_tenant_id_email", "tenant_id", "email", unique=True),
+        # Keyset pagination indexes, see crud.patient.get_patients_page
+        Index("ix_patients_tenant_id_last_name_id", "tenant_id", "last_name", "id"),
+        Index("ix_patients_tenant_id_created_at_id", "tenant_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
+    tenant_id = Column(Integer, ForeignKey("clinics.id"), nullable=False)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
     date_of_birth = Column(Date, nullable=False)
-    email = Column(String, unique=True, index=True)
+    email = Column(String)
     phone = Column(String)
     address = Column(String)
     medical_history = Column(Text)
     last_visit = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # Not null: keyset pages sort on it, and NULL would fall out of the row comparison
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow) 
\ No newline at end of file
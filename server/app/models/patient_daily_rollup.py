@@ -0,0 +1,12 @@
+from sqlalchemy import BigInteger, Column, Date, DateTime, ForeignKey, Integer
+from app.db.base_class import Base
+from datetime import datetime
+
+class PatientDailyRollup(Base):
+    __tablename__ = "patient_daily_rollups"
+
+    tenant_id = Column(Integer, ForeignKey("clinics.id"), primary_key=True)
+    # Patients registered on this (UTC) day that still exist
+    day = Column(Date, primary_key=True)
+    new_patients = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
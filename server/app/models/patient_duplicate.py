@@ -0,0 +1,40 @@
+from sqlalchemy import (
+    Column, DateTime, Float, ForeignKey, ForeignKeyConstraint, Index, Integer, String
+)
+from app.db.base_class import Base
+from datetime import datetime
+
+class PatientDuplicate(Base):
+    """
+    A pair of patients the dedupe job believes to be the same person,
+    waiting for review. The lower id is always patient_id.
+    """
+    __tablename__ = "patient_duplicates"
+    __table_args__ = (
+        Index("ix_patient_duplicates_pair", "patient_id", "duplicate_id", unique=True),
+        # Cascading deletes from patients.duplicate_id
+        Index("ix_patient_duplicates_duplicate_id", "duplicate_id"),
+        # A clinic's review queue: pending suggestions, best first
+        Index("ix_patient_duplicates_tenant_id_status_score", "tenant_id", "status", "score"),
+        ForeignKeyConstraint(
+            ["tenant_id", "patient_id"], ["patients.tenant_id", "patients.id"],
+            name="fk_patient_duplicates_patient", ondelete="CASCADE",
+        ),
+        ForeignKeyConstraint(
+            ["tenant_id", "duplicate_id"], ["patients.tenant_id", "patients.id"],
+            name="fk_patient_duplicates_duplicate", ondelete="CASCADE",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    # Both patients belong to this clinic; pairs never cross clinics
+    tenant_id = Column(Integer, ForeignKey("clinics.id"), nullable=False)
+    patient_id = Column(Integer, nullable=False)
+    duplicate_id = Column(Integer, nullable=False)
+    # 0..1 similarity, and the fields that matched, e.g. "last_name,date_of_birth,phone"
+    score = Column(Float, nullable=False)
+    reasons = Column(String, nullable=False, default="")
+    # pending or dismissed; merged pairs disappear with the merged patient
+    status = Column(String, nullable=False, default="pending")
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,11 +1,15 @@
-from sqlalchemy import Boolean, Column, Integer, String
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
 from app.db.base_class import Base
+# Registers the clinics table that tenant_id refers to
+from app.models.clinic import Clinic  # noqa: F401
 
 class User(Base):
     __tablename__ = "users"
 
     id = Column(Integer, primary_key=True, index=True)
+    # The clinic whose data this user works with
+    tenant_id = Column(Integer, ForeignKey("clinics.id"), nullable=False, index=True)
     email = Column(String, unique=True, index=True)
     hashed_password = Column(String)
     name = Column(String)
-    is_active = Column(Boolean, default=True) 
\ No newline at end of file
+    is_active = Column(Boolean, default=True)
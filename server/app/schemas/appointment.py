@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Literal, Optional
+from pydantic import BaseModel, field_validator, model_validator
+
+# Longest bookable appointment; bounds the index range the conflict check scans
+MAX_APPOINTMENT_DURATION = timedelta(hours=8)
+
+def as_naive_utc(moment: datetime) -> datetime:
+    # Appointment columns are naive UTC, like every timestamp in this app
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+AppointmentStatus = Literal["scheduled", "confirmed", "completed", "cancelled", "no_show"]
+
+class AppointmentBase(BaseModel):
+    patient_id: int
+    provider_id: int
+    start_time: datetime
+    end_time: datetime
+    status: AppointmentStatus = "scheduled"
+    reason: Optional[str] = None
+    notes: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def to_naive_utc(cls, value: datetime) -> datetime:
+        return as_naive_utc(value)
+
+    @model_validator(mode="after")
+    def check_times(self):
+        if self.end_time <= self.start_time:
+            raise ValueError("end_time must be after start_time")
+        if self.end_time - self.start_time > MAX_APPOINTMENT_DURATION:
+            raise ValueError(f"appointments may last at most {MAX_APPOINTMENT_DURATION}")
+        return self
+
+class AppointmentCreate(AppointmentBase):
+    pass
+
+class AppointmentUpdate(AppointmentBase):
+    pass
+
+class Appointment(AppointmentBase):
+    id: int
+    created_at: datetime
+    updated_at: datetime
+
+class CalendarEntry(Appointment):
+    patient_first_name: str
+    patient_last_name: str
+
+class Availability(BaseModel):
+    available: bool
+    conflicts: List[Appointment]
@@ -1,6 +1,6 @@
 from datetime import date, datetime
-from typing import Optional
-from pydantic import BaseModel, EmailStr
+from typing import List, Optional
+from pydantic import BaseModel, EmailStr, field_validator
 
 class PatientBase(BaseModel):
     first_name: str
@@ -12,7 +12,7 @@ class PatientBase(BaseModel):
     medical_history: Optional[str] = None
 
     class Config:
-        orm_mode = True
+        from_attributes = True
 
 class PatientCreate(PatientBase):
     pass
@@ -27,7 +27,7 @@ class Patient(PatientBase):
     updated_at: datetime
 
     class Config:
-        orm_mode = True
+        from_attributes = True
         json_schema_extra = {
             "example": {
                 "id": 1,
@@ -42,4 +42,45 @@ class Patient(PatientBase):
                 "created_at": "2024-03-19T00:00:00",
                 "updated_at": "2024-03-19T00:00:00"
             }
-        } 
\ No newline at end of file
+        } 
+
+class PatientSummary(BaseModel):
+    """
+    The columns list views render; requested with `fields=summary`.
+    """
+    id: int
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    last_visit: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class PatientPatch(BaseModel):
+    """
+    One item of a bulk PATCH: the patient id plus only the fields to change.
+    """
+    id: int
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    date_of_birth: Optional[date] = None
+    email: Optional[EmailStr] = None
+    phone: Optional[str] = None
+    address: Optional[str] = None
+    medical_history: Optional[str] = None
+    last_visit: Optional[datetime] = None
+
+    @field_validator("first_name", "last_name", "date_of_birth")
+    @classmethod
+    def not_null(cls, value):
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
+class PatientIds(BaseModel):
+    ids: List[int]
+
+class PatientPage(BaseModel):
+    items: List[Patient]
+    next_cursor: Optional[str] = None
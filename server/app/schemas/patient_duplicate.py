@@ -0,0 +1,27 @@
+from datetime import date, datetime
+from typing import List, Literal, Optional
+from pydantic import BaseModel
+
+DuplicateStatus = Literal["pending", "dismissed"]
+
+class DuplicatePatient(BaseModel):
+    id: int
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    email: Optional[str] = None
+    phone: Optional[str] = None
+
+class DuplicateSuggestion(BaseModel):
+    id: int
+    score: float
+    reasons: List[str]
+    status: DuplicateStatus
+    created_at: datetime
+    updated_at: datetime
+    patient: DuplicatePatient
+    duplicate: DuplicatePatient
+
+class MergeRequest(BaseModel):
+    # Which of the pair survives; the other is merged into it and deleted
+    keep_id: int
@@ -21,6 +21,7 @@ class UserLogin(BaseModel):
 
 class User(UserBase):
     id: int
+    tenant_id: int
     is_active: bool
 
     class Config:
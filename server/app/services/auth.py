@@ -1,12 +1,15 @@
+import secrets
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from jose import jwt
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin
 from fastapi import HTTPException, status
 from app.core.config import settings
-from app.core.password import verify_password, get_password_hash
+from app.crud import clinic as clinic_crud
+from app.services.password_hasher import password_hasher
 
 # Security configuration
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
@@ -21,15 +24,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-    user = db.query(User).filter(User.email == email).first()
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
+    result = await db.execute(select(User).where(User.email == email))
+    user = result.scalars().first()
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await password_hasher.verify(password, user.hashed_password):
         return None
     return user
 
-def create_user(db: Session, user: UserCreate) -> dict:
+async def create_user(db: AsyncSession, user: UserCreate) -> dict:
     # Check if passwords match
     if user.password != user.confirm_password:
         raise HTTPException(
@@ -38,23 +42,35 @@ def create_user(db: Session, user: UserCreate) -> dict:
         )
     
     # Check if user already exists
-    db_user = db.query(User).filter(User.email == user.email).first()
+    result = await db.execute(select(User).where(User.email == user.email))
+    db_user = result.scalars().first()
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
+    # Hashed first: a busy or failing hasher must not leave a clinic behind
+    hashed_password = await password_hasher.hash(user.password)
+
+    # Every signup gets an empty clinic of its own, created in the same
+    # transaction as the user; joining an existing one takes the move-user
+    # command. On a list-partitioned patients table its rows land in
+    # patients_default.
+    clinic = await clinic_crud.create_clinic(
+        db, f"{user.name}'s clinic", f"clinic-{secrets.token_hex(8)}"
+    )
+
     # Create new user
-    hashed_password = get_password_hash(user.password)
     db_user = User(
         email=user.email,
         name=user.name,
-        hashed_password=hashed_password
+        hashed_password=hashed_password,
+        tenant_id=clinic.id,
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     # Return user data in the format expected by frontend
     return {
@@ -63,8 +79,8 @@ def create_user(db: Session, user: UserCreate) -> dict:
         "name": db_user.name
     }
 
-def login_user(db: Session, user_data: UserLogin) -> dict:
-    user = authenticate_user(db, user_data.email, user_data.password)
+async def login_user(db: AsyncSession, user_data: UserLogin) -> dict:
+    user = await authenticate_user(db, user_data.email, user_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,9 +1,14 @@
-from typing import Dict, List
-import re
+from typing import Dict, List, Tuple
+import json
+import os
 import random
+import time
+from app.core.config import settings
+from app.core.metrics import CHATBOT_INTENTS
+from app.services.intent_matcher import IntentMatcher
 
 class ChatbotService:
-    def __init__(self):
+    def __init__(self, keywords_path: str = settings.CHATBOT_KEYWORDS_PATH):
         self.templates = {
             "greeting": [
                 "Hello! How can I help you today?",
@@ -37,20 +42,45 @@ class ChatbotService:
             ]
         }
         
-        self.keywords = {
-            "greeting": ["hello", "hi", "hey", "greetings"],
-            "appointment": ["appointment", "schedule", "booking", "book", "when", "available"],
-            "procedure": ["procedure", "treatment", "extraction", "filling", "root canal", "cleaning"],
-            "emergency": ["emergency", "urgent", "pain", "hurt", "swelling", "bleeding"],
-            "cost": ["cost", "price", "expensive", "insurance", "payment", "bill"]
-        }
+        self.keywords_path = keywords_path
+        self._keywords_mtime = None
+        self._next_reload_check = 0.0
+        self.reload_keywords()
+
+    def reload_keywords(self) -> None:
+        """
+        Load the keyword table from the data file and recompile the matcher.
+        """
+        with open(self.keywords_path) as f:
+            keywords: Dict[str, List[str]] = json.load(f)
+        # Only topics that have response templates can be answered
+        self.keywords = {topic: words for topic, words in keywords.items() if topic in self.templates}
+        self.matcher = IntentMatcher(self.keywords)
+        self._keywords_mtime = os.stat(self.keywords_path).st_mtime
+
+    def _maybe_reload_keywords(self) -> None:
+        # Pick up edits to the keyword file without a restart, checking its
+        # mtime at most once per CHATBOT_KEYWORDS_RELOAD_SECONDS
+        now = time.monotonic()
+        if now < self._next_reload_check:
+            return
+        self._next_reload_check = now + settings.CHATBOT_KEYWORDS_RELOAD_SECONDS
+        try:
+            if os.stat(self.keywords_path).st_mtime != self._keywords_mtime:
+                self.reload_keywords()
+        except (OSError, ValueError) as e:
+            print(f"Could not reload chatbot keywords: {e}")
+
+    def classify(self, message: str) -> List[Tuple[str, float]]:
+        """
+        Return all matched intents with their scores, best first.
+        """
+        self._maybe_reload_keywords()
+        return self.matcher.match(message)
 
     def _identify_topic(self, message: str) -> str:
-        message = message.lower()
-        for topic, words in self.keywords.items():
-            if any(word in message for word in words):
-                return topic
-        return "default"
+        intents = self.classify(message)
+        return intents[0][0] if intents else "default"
 
     def _extract_topic_from_message(self, message: str) -> str:
         # Extract potential topic words from the message
@@ -60,13 +90,8 @@ class ChatbotService:
         topic_words = [word for word in words if word not in common_words]
         return " ".join(topic_words[:3])  # Return up to 3 words as the topic
 
-    def get_response(self, message: str) -> str:
-        """
-        Get a response from the chatbot for the given message.
-        """
-        # Identify the topic of the message
-        topic = self._identify_topic(message)
-        
+    def _respond_to_topic(self, topic: str, message: str) -> str:
+        CHATBOT_INTENTS.labels(topic).inc()
         # Get a random response template for the identified topic
         if topic == "default":
             # For default responses, include the extracted topic words
@@ -76,5 +101,22 @@ class ChatbotService:
         else:
             return random.choice(self.templates[topic])
 
+    def get_response(self, message: str) -> str:
+        """
+        Get a response from the chatbot for the given message.
+        """
+        # Identify the topic of the message
+        topic = self._identify_topic(message)
+        return self._respond_to_topic(topic, message)
+
+    def answer(self, message: str) -> Tuple[str, List[Tuple[str, float]]]:
+        """
+        Classify a message and answer it in one pass, returning the response
+        together with all matched intents.
+        """
+        intents = self.classify(message)
+        topic = intents[0][0] if intents else "default"
+        return self._respond_to_topic(topic, message), intents
+
 # Create a singleton instance
 chatbot_service = ChatbotService() 
\ No newline at end of file
@@ -0,0 +1,167 @@
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+from sqlalchemy import cast, Date, extract, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.crud import clinic as clinic_crud
+from app.crud import dashboard_counter as counter_crud
+from app.crud import patient_rollup as rollup_crud
+from app.models.patient import Patient
+
+# Counter families owned by this module, checked by reconcile_counters
+PATIENT_COUNTER_PREFIXES = ("total_patients:", "new_patients:")
+# Counts periodic rebuilds; its updated_at is when the last one was claimed
+REBUILDS_KEY = "stats_rebuilds"
+# Postgres advisory lock held by the process running the periodic rebuild
+REBUILD_LOCK_ID = 7_210_431
+
+async def compute_patient_counters(
+    db: AsyncSession, tenant_id: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Compute the patient counters of one clinic (every clinic when None) from
+    scratch with full scans.
+    """
+    tenant_filter = [] if tenant_id is None else [Patient.tenant_id == tenant_id]
+    result = await db.execute(
+        select(Patient.tenant_id, func.count(Patient.id))
+        .where(*tenant_filter)
+        .group_by(Patient.tenant_id)
+    )
+    counters = {
+        counter_crud.total_patients_key(tenant_id): count for tenant_id, count in result.all()
+    }
+    year = extract("year", Patient.created_at)
+    month = extract("month", Patient.created_at)
+    result = await db.execute(
+        select(Patient.tenant_id, year, month, func.count(Patient.id))
+        .where(Patient.created_at.is_not(None), *tenant_filter)
+        .group_by(Patient.tenant_id, year, month)
+    )
+    for tenant_id, y, m, count in result.all():
+        counters[counter_crud.new_patients_key(tenant_id, datetime(int(y), int(m), 1))] = count
+    return counters
+
+async def rebuild_counters(db: AsyncSession) -> Dict[str, int]:
+    """
+    Recompute the patient counters, one clinic per transaction.
+    """
+    counters = {}
+    for tenant_id in [clinic.id for clinic in await clinic_crud.get_clinics(db)]:
+        # Waits for the clinic's in-flight creates and deletes, and holds
+        # new ones back until the rebuilt values commit; other clinics and
+        # plain updates carry on.
+        await counter_crud.lock_tenant_counters(db, tenant_id)
+        tenant_counters = await compute_patient_counters(db, tenant_id)
+        tenant_counters.setdefault(counter_crud.total_patients_key(tenant_id), 0)
+        await counter_crud.replace_tenant_counters(db, tenant_id, tenant_counters)
+        await db.commit()
+        counters.update(tenant_counters)
+    return counters
+
+async def reconcile_counters(db: AsyncSession) -> Dict[str, Dict[str, int]]:
+    """
+    Compare stored counters with real counts and return the mismatches as
+    {key: {"stored": ..., "actual": ...}}.
+    """
+    actual = await compute_patient_counters(db)
+    stored = {
+        key: value
+        for key, value in (await counter_crud.get_all_counters(db)).items()
+        if key.startswith(PATIENT_COUNTER_PREFIXES)
+    }
+    mismatches = {}
+    for key in sorted(set(actual) | set(stored)):
+        if stored.get(key, 0) != actual.get(key, 0):
+            mismatches[key] = {"stored": stored.get(key, 0), "actual": actual.get(key, 0)}
+    return mismatches
+
+async def compute_daily_counts(
+    db: AsyncSession,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    tenant_id: Optional[int] = None,
+) -> Dict[Tuple[int, date], int]:
+    """
+    Count patients per clinic and creation day in [start, end] with a full
+    scan, of one clinic when `tenant_id` is given.
+    """
+    day = func.date(Patient.created_at)
+    if db.get_bind().dialect.name == "postgresql":
+        day = cast(Patient.created_at, Date)
+    stmt = select(Patient.tenant_id, day, func.count(Patient.id)).where(
+        Patient.created_at.is_not(None)
+    )
+    if tenant_id is not None:
+        stmt = stmt.where(Patient.tenant_id == tenant_id)
+    if start is not None:
+        stmt = stmt.where(Patient.created_at >= datetime.combine(start, datetime.min.time()))
+    if end is not None:
+        stmt = stmt.where(
+            Patient.created_at < datetime.combine(end + timedelta(days=1), datetime.min.time())
+        )
+    result = await db.execute(stmt.group_by(Patient.tenant_id, day))
+    # SQLite returns the day as text
+    return {
+        (tenant_id, date.fromisoformat(str(value)[:10])): count
+        for tenant_id, value, count in result.all()
+    }
+
+async def backfill_daily_rollups(
+    db: AsyncSession, start: Optional[date] = None, end: Optional[date] = None
+) -> Dict[Tuple[int, date], int]:
+    """
+    Recompute the daily rollup rows in [start, end] (everything when open)
+    from the patients table, one clinic per transaction.
+    """
+    counts = {}
+    for tenant_id in [clinic.id for clinic in await clinic_crud.get_clinics(db)]:
+        # Same lock as rebuild_counters: creates and deletes take it before
+        # touching their rollup rows
+        await counter_crud.lock_tenant_counters(db, tenant_id)
+        tenant_counts = await compute_daily_counts(db, start, end, tenant_id)
+        await rollup_crud.replace_range(
+            db, tenant_id, {day: count for (_, day), count in tenant_counts.items()}, start, end
+        )
+        await db.commit()
+        counts.update(tenant_counts)
+    return counts
+
+async def rebuild_if_due(db: AsyncSession) -> bool:
+    """
+    Rebuild the counters unless another process has claimed the rebuild
+    within the last DASHBOARD_STATS_REBUILD_SECONDS. Returns whether it ran.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        # Held until the claim below commits; by then the rebuild count has
+        # moved on, so the other workers skip this interval
+        locked = await db.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": REBUILD_LOCK_ID}
+        )
+        if not locked:
+            await db.rollback()
+            return False
+    _, rebuilt_at = await counter_crud.get_counter(db, REBUILDS_KEY)
+    interval = timedelta(seconds=settings.DASHBOARD_STATS_REBUILD_SECONDS)
+    if rebuilt_at is not None and datetime.utcnow() - rebuilt_at < interval:
+        await db.rollback()
+        return False
+    await counter_crud.increment(db, REBUILDS_KEY)
+    await db.commit()
+    await rebuild_counters(db)
+    return True
+
+async def run_periodic_rebuild(session_factory) -> None:
+    """
+    Background loop that rebuilds the counters every
+    DASHBOARD_STATS_REBUILD_SECONDS to repair any drift. Every web worker
+    runs it, but only one of them rebuilds per interval.
+    """
+    while True:
+        await asyncio.sleep(settings.DASHBOARD_STATS_REBUILD_SECONDS)
+        try:
+            async with session_factory() as db:
+                await rebuild_if_due(db)
+        except Exception as e:
+            print(f"Dashboard stats rebuild failed: {e}")
@@ -0,0 +1,67 @@
+import re
+from typing import Dict, Iterable, List, Tuple
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation from a trie of the words, so matching costs
+    roughly one pass over the message however many keywords there are.
+    Spaces inside a keyword match any run of whitespace.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: Dict) -> str:
+        ends_here = "" in node
+        branches = []
+        for char in sorted(k for k in node if k):
+            prefix = r"\s+" if char == " " else re.escape(char)
+            branches.append(prefix + render(node[char]))
+        if not branches:
+            return ""
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        body = "(?:" + "|".join(branches) + ")"
+        # Greedy optional group prefers the longest keyword
+        return body + "?" if ends_here else body
+
+    return render(trie)
+
+class IntentMatcher:
+    """
+    Keyword intent classifier compiled into a single word-bounded regex.
+    """
+
+    def __init__(self, keywords: Dict[str, List[str]]):
+        # Topic order breaks score ties, matching the order of the keyword file
+        self.topics = list(keywords)
+        self.keyword_topics: Dict[str, List[str]] = {}
+        for topic, words in keywords.items():
+            for word in words:
+                normalized = " ".join(word.lower().split())
+                if normalized:
+                    self.keyword_topics.setdefault(normalized, []).append(topic)
+        if self.keyword_topics:
+            self.pattern = re.compile(r"\b(?:" + _trie_pattern(self.keyword_topics) + r")\b")
+        else:
+            self.pattern = None
+
+    def match(self, message: str) -> List[Tuple[str, float]]:
+        """
+        Return every matched intent with its score (share of keyword hits),
+        best first.
+        """
+        if self.pattern is None:
+            return []
+        hits: Dict[str, int] = {}
+        total = 0
+        for found in self.pattern.finditer(message.lower()):
+            keyword = " ".join(found.group().split())
+            for topic in self.keyword_topics[keyword]:
+                hits[topic] = hits.get(topic, 0) + 1
+                total += 1
+        ranked = sorted(hits.items(), key=lambda item: (-item[1], self.topics.index(item[0])))
+        return [(topic, count / total) for topic, count in ranked]
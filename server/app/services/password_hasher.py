@@ -0,0 +1,140 @@
+import asyncio
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.password import verify_password, get_password_hash
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a dedicated process pool so CPU-bound hashing neither
+    holds the GIL of the API worker nor occupies its thread pool.
+
+    At most `max_concurrency` calls are submitted at once; further callers
+    wait up to `queue_timeout` seconds and are then rejected with a 503.
+    """
+
+    def __init__(self, max_workers: int, max_concurrency: int, queue_timeout: float):
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self._latencies = deque(maxlen=1024)
+        self._wait_times = deque(maxlen=1024)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # The semaphore must belong to the running loop
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.max_workers <= 0:
+            return None
+        if self._executor is None:
+            # spawn, not fork: never copy the API worker's sockets and threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        # Concurrent callers see the same broken pool; only the first one
+        # replaces it, the rest already find a fresh one
+        if self._executor is executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        semaphore = self._get_semaphore()
+        queued_at = time.perf_counter()
+        self.queued += 1
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+        finally:
+            self.queued -= 1
+
+        started_at = time.perf_counter()
+        self._wait_times.append(started_at - queued_at)
+        self.in_flight += 1
+        try:
+            executor = self._get_executor()
+            if executor is None:
+                return await run_in_threadpool(func, *args)
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                # A worker process died (OOM kill, crash) and took the pool
+                # with it; retry once on a fresh one
+                self._discard_executor(executor)
+                return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self._latencies.append(time.perf_counter() - started_at)
+            semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @staticmethod
+    def _percentiles(samples) -> Dict[str, float]:
+        if not samples:
+            return {"p50Ms": 0.0, "p99Ms": 0.0, "maxMs": 0.0}
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {
+            "p50Ms": ordered[int(last * 0.5)] * 1000,
+            "p99Ms": ordered[int(last * 0.99)] * 1000,
+            "maxMs": ordered[-1] * 1000,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "maxConcurrency": self.max_concurrency,
+            "queueDepth": self.queued,
+            "inFlight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "hashLatency": self._percentiles(self._latencies),
+            "queueWait": self._percentiles(self._wait_times),
+        }
+
+# Create a singleton instance
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+    queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,237 @@
+"""
+Duplicate patient detection.
+
+Comparing every pair is quadratic, so patients are grouped by blocking keys
+(normalized last name + date of birth, phonetic names + birth year, phone
+digits, email) and only patients sharing a key are scored. Blocks larger
+than DEDUPE_MAX_BLOCK_SIZE (a placeholder phone, a very common name) are
+compared with a sorted sliding window instead, which keeps the number of
+comparisons proportional to the number of patients. Each clinic is
+scanned separately; pairs never cross clinics.
+"""
+import re
+import time
+import unicodedata
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.crud import patient as patient_crud
+from app.crud import patient_duplicate as duplicate_crud
+
+DEDUPE_FIELDS = ["first_name", "last_name", "date_of_birth", "phone", "email"]
+
+# Weights of the name, date of birth and contact similarities in the score
+NAME_WEIGHT = 0.5
+DOB_WEIGHT = 0.3
+CONTACT_WEIGHT = 0.2
+
+SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"), **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"), "l": "4", **dict.fromkeys("mn", "5"), "r": "6",
+}
+# Blocking keys are hashed into the high bits of one int per (key, patient)
+KEY_MASK = (1 << 48) - 1
+
+# (first name, last name, date of birth, phone digits, email), normalized
+Features = Tuple[str, str, date, str, str]
+
+def normalize_name(value: Optional[str]) -> str:
+    """
+    Lower-case ASCII letters only: "Zoë O'Brien-Smith" -> "zoeobriensmith".
+    """
+    value = unicodedata.normalize("NFKD", value or "")
+    return re.sub(r"[^a-z]", "", value.encode("ascii", "ignore").decode().lower())
+
+def phone_digits(value: Optional[str]) -> str:
+    # The last 10 digits, so "+1 555 0100 200" and "(555) 0100-200" agree
+    return re.sub(r"\D", "", value or "")[-10:]
+
+def soundex(name: str) -> str:
+    """
+    American Soundex of a normalized name, e.g. "robert" and "rupert" -> "r163".
+    """
+    if not name:
+        return ""
+    code, previous = name[0], SOUNDEX_CODES.get(name[0], "")
+    for char in name[1:]:
+        digit = SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+        if char not in "hw":
+            previous = digit
+    return (code + "000")[:4]
+
+def jaro_winkler(a: str, b: str) -> float:
+    if a == b:
+        return 1.0 if a else 0.0
+    if not a or not b:
+        return 0.0
+    window = max(0, max(len(a), len(b)) // 2 - 1)
+    matched_b = [False] * len(b)
+    matches_a = []
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(len(b), i + window + 1)):
+            if not matched_b[j] and b[j] == char:
+                matched_b[j] = True
+                matches_a.append(char)
+                break
+    if not matches_a:
+        return 0.0
+    matches_b = [char for char, matched in zip(b, matched_b) if matched]
+    transpositions = sum(x != y for x, y in zip(matches_a, matches_b)) / 2
+    m = len(matches_a)
+    jaro = (m / len(a) + m / len(b) + (m - transpositions) / m) / 3
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * 0.1 * (1 - jaro)
+
+def features(row: Dict[str, Any]) -> Features:
+    return (
+        normalize_name(row["first_name"]),
+        normalize_name(row["last_name"]),
+        row["date_of_birth"],
+        phone_digits(row["phone"]),
+        (row["email"] or "").strip().lower(),
+    )
+
+def blocking_keys(record: Features) -> List[str]:
+    first, last, dob, phone, email = record
+    # Sorted phonetic codes, so swapped first and last names share the key
+    phonetic = "".join(sorted([soundex(first), soundex(last)]))
+    keys = [f"n:{last}:{dob.isoformat()}", f"s:{phonetic}:{dob.year}"]
+    if len(phone) >= 7:
+        keys.append(f"p:{phone}")
+    if email:
+        keys.append(f"e:{email}")
+    return keys
+
+def _dob_similarity(a: date, b: date) -> float:
+    if a == b:
+        return 1.0
+    if a.year == b.year and a.month == b.day and a.day == b.month:
+        # Day and month swapped
+        return 0.8
+    if (a.year == b.year) + (a.month == b.month) + (a.day == b.day) == 2:
+        # One part mistyped
+        return 0.6
+    return 0.0
+
+def score_pair(a: Features, b: Features) -> Tuple[float, List[str]]:
+    """
+    Similarity of two patients in [0, 1] and the fields that matched.
+    """
+    names = max(
+        jaro_winkler(a[0], b[0]) + jaro_winkler(a[1], b[1]),
+        # First and last name entered the other way round
+        jaro_winkler(a[0], b[1]) + jaro_winkler(a[1], b[0]),
+    ) / 2
+    dob = _dob_similarity(a[2], b[2])
+    phone = bool(a[3]) and a[3] == b[3]
+    email = bool(a[4]) and a[4] == b[4]
+    if phone or email:
+        contact = 1.0
+    elif a[3] and b[3]:
+        contact = 0.0
+    else:
+        # Nothing to compare; neither for nor against
+        contact = 0.5
+
+    reasons = []
+    if names >= 0.9:
+        reasons.append("name")
+    if dob == 1.0:
+        reasons.append("date_of_birth")
+    if phone:
+        reasons.append("phone")
+    if email:
+        reasons.append("email")
+    return NAME_WEIGHT * names + DOB_WEIGHT * dob + CONTACT_WEIGHT * contact, reasons
+
+def candidate_pairs(
+    records: Dict[int, Features], max_block_size: int, window: int
+) -> Iterator[Tuple[int, int]]:
+    """
+    Yield each pair of patient ids sharing a blocking key once, lower id first.
+    """
+    entries = []
+    for patient_id, record in records.items():
+        for key in blocking_keys(record):
+            entries.append((hash(key) & KEY_MASK) << 32 | patient_id)
+    # Sorting brings each block together without a dict of lists per key
+    entries.sort()
+
+    seen = set()
+    start = 0
+    while start < len(entries):
+        key = entries[start] >> 32
+        end = start + 1
+        while end < len(entries) and entries[end] >> 32 == key:
+            end += 1
+        block = [entry & 0xFFFFFFFF for entry in entries[start:end]]
+        start = end
+        if len(block) < 2:
+            continue
+        if len(block) > max_block_size:
+            # Sorted neighbourhood: compare each patient with the next few by name
+            block.sort(key=lambda patient_id: records[patient_id][1::-1])
+            span = window
+        else:
+            span = len(block)
+        for i, a in enumerate(block):
+            for b in block[i + 1:i + 1 + span]:
+                low, high = min(a, b), max(a, b)
+                if low << 32 | high not in seen:
+                    seen.add(low << 32 | high)
+                    yield low, high
+
+async def find_duplicates(
+    db: AsyncSession,
+    tenant_id: int,
+    min_score: Optional[float] = None,
+    max_block_size: Optional[int] = None,
+    window: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Scan the clinic's patients and store the pairs scoring at least `min_score` as
+    pending suggestions. Suggestions already reviewed keep their status;
+    pending ones that no longer match are removed. Returns run statistics.
+    """
+    min_score = settings.DEDUPE_MIN_SCORE if min_score is None else min_score
+    started = time.perf_counter()
+    run_started = datetime.utcnow()
+
+    records: Dict[int, Features] = {}
+    async for batch in patient_crud.stream_patient_rows(
+        db, tenant_id, settings.IMPORT_BATCH_SIZE, fields=DEDUPE_FIELDS
+    ):
+        for row in batch:
+            records[row["id"]] = features(row)
+
+    comparisons = 0
+    suggestions = []
+    for a, b in candidate_pairs(
+        records,
+        max_block_size or settings.DEDUPE_MAX_BLOCK_SIZE,
+        window or settings.DEDUPE_WINDOW,
+    ):
+        comparisons += 1
+        score, reasons = score_pair(records[a], records[b])
+        if score >= min_score:
+            suggestions.append({
+                "patient_id": a,
+                "duplicate_id": b,
+                "score": round(score, 4),
+                "reasons": ",".join(reasons),
+            })
+
+    await duplicate_crud.store_suggestions(db, tenant_id, suggestions, run_started)
+    return {
+        "patients": len(records),
+        "comparisons": comparisons,
+        "suggestions": len(suggestions),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
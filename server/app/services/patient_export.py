@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import AsyncIterator, Callable
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud import patient as patient_crud
+from app.db.session import SessionLocal
+
+EXPORT_COLUMNS = patient_crud.PATIENT_FIELDS
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+async def _encode_rows(
+    tenant_id: int,
+    format: str,
+    batch_size: int,
+    session_factory: Callable[[], AsyncSession],
+) -> AsyncIterator[bytes]:
+    # The response outlives the request's dependencies, so the stream owns its session
+    async with session_factory() as db:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if format == "csv":
+            writer.writerow(EXPORT_COLUMNS)
+        async for rows in patient_crud.stream_patient_rows(
+            db, tenant_id, batch_size=batch_size
+        ):
+            if format == "csv":
+                writer.writerows(
+                    [row[column] for column in EXPORT_COLUMNS] for row in rows
+                )
+            else:
+                for row in rows:
+                    buffer.write(json.dumps(dict(row), default=_json_default))
+                    buffer.write("\n")
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+async def export_patients(
+    tenant_id: int,
+    format: str,
+    compress: bool = False,
+    batch_size: int = 1000,
+    session_factory: Callable[[], AsyncSession] = SessionLocal,
+) -> AsyncIterator[bytes]:
+    """
+    Stream every patient of the clinic as CSV or NDJSON, optionally gzip-compressed, one
+    database batch at a time.
+    """
+    if not compress:
+        async for chunk in _encode_rows(tenant_id, format, batch_size, session_factory):
+            yield chunk
+        return
+    gzip = zlib.compressobj(wbits=31)  # 31 = gzip container
+    async for chunk in _encode_rows(tenant_id, format, batch_size, session_factory):
+        compressed = gzip.compress(chunk)
+        if compressed:
+            yield compressed
+    yield gzip.flush()
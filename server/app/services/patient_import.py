@@ -0,0 +1,164 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.crud import patient as patient_crud
+from app.schemas.patient import PatientCreate
+
+# Cap on per-row errors kept in the report so memory stays bounded
+MAX_REPORTED_ERRORS = 1000
+
+async def iter_records(chunks: AsyncIterator[bytes], format: str) -> AsyncIterator[str]:
+    """
+    Turn a stream of byte chunks into complete records (one NDJSON line, or
+    one CSV record which may span several lines inside quotes).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    record = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            record += line + "\n"
+            # A CSV newline only ends the record outside quotes
+            if format == "csv" and record.count('"') % 2:
+                continue
+            yield record
+            record = ""
+    record += pending + decoder.decode(b"", final=True)
+    if record.strip():
+        yield record
+
+async def iter_rows(chunks: AsyncIterator[bytes], format: str) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Yield (row number, parsed row) pairs; row is a dict, or an Exception
+    when the record could not be parsed.
+    """
+    header: Optional[List[str]] = None
+    row_number = 0
+    async for record in iter_records(chunks, format):
+        if not record.strip():
+            continue
+        if format == "csv":
+            values = next(csv.reader([record]))
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            row_number += 1
+            if len(values) != len(header):
+                yield row_number, ValueError(
+                    f"expected {len(header)} columns, got {len(values)}"
+                )
+                continue
+            # Empty cells are left out, so an update keeps what is stored there
+            yield row_number, {k: v for k, v in zip(header, values) if v != ""}
+        else:
+            row_number += 1
+            try:
+                row = json.loads(record)
+            except ValueError as e:
+                yield row_number, ValueError(f"invalid JSON: {e}")
+                continue
+            if not isinstance(row, dict):
+                yield row_number, ValueError("expected a JSON object")
+                continue
+            yield row_number, row
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" for e in error.errors()
+    )
+
+class ImportReport:
+    def __init__(self):
+        self.rows = 0
+        self.inserted = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Any]] = []
+
+    def add_error(self, row: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "error": error})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errorsTruncated": self.failed > len(self.errors),
+        }
+
+async def _flush_batch(
+    db: AsyncSession,
+    tenant_id: int,
+    batch: List[Tuple[int, Dict]],
+    on_conflict: str,
+    report: ImportReport,
+) -> None:
+    # Within one statement each email may appear only once: when skipping
+    # conflicts the first row wins, when updating the last one does
+    by_email: Dict[str, int] = {}
+    for index, (row_number, row) in enumerate(batch):
+        email = row.get("email")
+        if not email:
+            continue
+        if email not in by_email:
+            by_email[email] = index
+        elif on_conflict == "skip":
+            report.add_error(row_number, "duplicate email in upload")
+        else:
+            report.add_error(batch[by_email[email]][0], "duplicate email in upload")
+            by_email[email] = index
+    keep = [
+        (row_number, row) for index, (row_number, row) in enumerate(batch)
+        if not row.get("email") or by_email[row["email"]] == index
+    ]
+    inserted, updated, existing = await patient_crud.bulk_insert_patients(
+        db, tenant_id, [row for _, row in keep], on_conflict=on_conflict
+    )
+    report.inserted += inserted
+    report.updated += updated
+    if on_conflict == "skip":
+        for row_number, row in keep:
+            if row.get("email") in existing:
+                report.add_error(row_number, "email already registered")
+
+async def import_patients(
+    db: AsyncSession,
+    tenant_id: int,
+    chunks: AsyncIterator[bytes],
+    format: str,
+    on_conflict: str = "skip",
+) -> Dict[str, Any]:
+    """
+    Stream an upload into the clinic's patients in batches of IMPORT_BATCH_SIZE
+    rows, each validated against PatientCreate and inserted in one transaction.
+    Only one batch is held in memory at a time.
+    """
+    report = ImportReport()
+    batch: List[Tuple[int, Dict]] = []
+    async for row_number, row in iter_rows(chunks, format):
+        report.rows += 1
+        if isinstance(row, Exception):
+            report.add_error(row_number, str(row))
+            continue
+        try:
+            patient = PatientCreate.model_validate(row)
+        except ValidationError as e:
+            report.add_error(row_number, _format_validation_error(e))
+            continue
+        batch.append((row_number, patient.model_dump(exclude_unset=True)))
+        if len(batch) >= settings.IMPORT_BATCH_SIZE:
+            await _flush_batch(db, tenant_id, batch, on_conflict, report)
+            batch = []
+    if batch:
+        await _flush_batch(db, tenant_id, batch, on_conflict, report)
+    return report.to_dict()
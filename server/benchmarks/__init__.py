@@ -0,0 +1,3 @@
+"""
+Benchmarks, run from the server directory with `python -m benchmarks.<name>`.
+"""
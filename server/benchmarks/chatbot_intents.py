@@ -0,0 +1,61 @@
+"""
+Microbenchmark: per-message cost of the compiled IntentMatcher against the
+previous substring scan, as the keyword table grows.
+
+    python -m benchmarks.chatbot_intents [--messages 2000]
+"""
+import argparse
+import random
+import string
+import time
+from typing import Dict, List
+from app.services.intent_matcher import IntentMatcher
+
+SAMPLE_MESSAGES = [
+    "Hi, I would like to book a cleaning next week",
+    "How much does a root canal cost with my insurance?",
+    "My tooth is bleeding and the pain is getting worse",
+    "What time do you open on Saturdays?",
+    "Is the hygienist available for a filling on Monday?",
+]
+
+def synthetic_keywords(size: int, seed: int = 0) -> Dict[str, List[str]]:
+    rng = random.Random(seed)
+    topics: Dict[str, List[str]] = {f"topic{i}": [] for i in range(10)}
+    names = list(topics)
+    for i in range(size):
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+        topics[names[i % len(names)]].append(word)
+    topics["topic0"] += ["cleaning", "root canal", "pain", "insurance"]
+    return topics
+
+def substring_scan(keywords: Dict[str, List[str]], message: str) -> str:
+    # The original ChatbotService._identify_topic
+    message = message.lower()
+    for topic, words in keywords.items():
+        if any(word in message for word in words):
+            return topic
+    return "default"
+
+def time_per_message(func, messages: List[str]) -> float:
+    start = time.perf_counter()
+    for message in messages:
+        func(message)
+    return (time.perf_counter() - start) / len(messages) * 1e6
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=2000)
+    args = parser.parse_args()
+    messages = [SAMPLE_MESSAGES[i % len(SAMPLE_MESSAGES)] for i in range(args.messages)]
+
+    print(f"{'keywords':>9} {'substring us/msg':>17} {'compiled us/msg':>16} {'speedup':>8}")
+    for size in (10, 100, 1000, 5000):
+        keywords = synthetic_keywords(size)
+        matcher = IntentMatcher(keywords)
+        baseline = time_per_message(lambda m: substring_scan(keywords, m), messages)
+        compiled = time_per_message(matcher.match, messages)
+        print(f"{size:>9} {baseline:>17.2f} {compiled:>16.2f} {baseline / compiled:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Load test: drives the API's main endpoints at a fixed concurrency and
+reports throughput and p50/p99 latency per scenario.
+
+Seed first (`python -m benchmarks.seed --size 100k`), then either point it
+at a running server or run the app in-process against DATABASE_URL; the
+in-process app goes through its full startup (pool warm-up, change feed)
+before the first request, like a server behind a readiness check:
+
+    python -m benchmarks.load --base-url http://localhost:8000
+    python -m benchmarks.load --in-process --output results.json \\
+        --baseline baseline.json --threshold 0.15
+
+The request mix is drawn from a seeded RNG so runs are repeatable. With
+--baseline the process exits 1 on any regression beyond --threshold.
+Patients created by the run are updated and then deleted again, so the
+seeded data set stays the same between runs.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List
+import httpx
+from benchmarks import report
+from benchmarks.seed import BENCH_EMAIL, BENCH_PASSWORD
+
+SCENARIOS = [
+    "login", "me", "patients_list", "patients_get", "patients_create",
+    "patients_update", "patients_delete", "dashboard_stats", "chat",
+]
+
+CHAT_MESSAGES = [
+    "Hello there",
+    "I need to book an appointment for a cleaning",
+    "How much does a filling cost?",
+    "What are your opening hours on Saturday?",
+    "My tooth hurts when I drink something cold",
+    "Do you accept my insurance?",
+]
+
+def new_patient(rng: random.Random, run_id: str, index: int) -> Dict[str, Any]:
+    return {
+        "first_name": rng.choice(["Ann", "Ben", "Cleo", "Dev"]),
+        "last_name": f"Load{rng.randrange(1000)}",
+        "date_of_birth": f"19{rng.randrange(40, 99)}-0{rng.randrange(1, 9)}-1{rng.randrange(9)}",
+        "email": f"load.{run_id}.{index}@bench.example.com",
+        "phone": "+1 555 0100",
+        "medical_history": "Created by the load test.",
+    }
+
+async def run_scenario(
+    request: Callable[[int], Awaitable[httpx.Response]],
+    count: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    """
+    Issue `count` requests, `concurrency` at a time; request(i) sends the i-th.
+    """
+    latencies: List[float] = []
+    errors = 0
+    next_index = iter(range(count))
+
+    async def worker():
+        nonlocal errors
+        for i in next_index:
+            started = time.perf_counter()
+            try:
+                response = await request(i)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return report.summarize(latencies, errors, time.perf_counter() - started)
+
+async def run(client: httpx.AsyncClient, args) -> Dict[str, Dict[str, Any]]:
+    rng = random.Random(args.seed)
+    # Only the emails of created patients differ between runs, to stay unique
+    run_id = uuid.uuid4().hex[:12]
+    credentials = {"email": BENCH_EMAIL, "password": BENCH_PASSWORD}
+
+    response = await client.post("/api/auth/login", json=credentials)
+    response.raise_for_status()
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+    sample = await client.get("/api/v1/patients/", params={"fields": "id", "limit": 1000})
+    sample.raise_for_status()
+    ids = [row["id"] for row in sample.json()]
+    if not ids:
+        sys.exit("No patients found, seed the database with benchmarks.seed first")
+    picks = [rng.choice(ids) for _ in range(args.requests)]
+    messages = [rng.choice(CHAT_MESSAGES) for _ in range(args.requests)]
+    bodies = [new_patient(rng, run_id, i) for i in range(args.requests)]
+    created: List[int] = []
+
+    async def create(i):
+        response = await client.post("/api/v1/patients/", json=bodies[i])
+        if response.status_code == 200:
+            created.append(response.json()["id"])
+        return response
+
+    def update(i):
+        body = {key: value for key, value in bodies[i].items() if key != "email"}
+        body["last_name"] = "Updated"
+        return client.put(f"/api/v1/patients/{created[i % len(created)]}", json=body)
+
+    requests = {
+        "login": lambda i: client.post("/api/auth/login", json=credentials),
+        "me": lambda i: client.get("/api/auth/me"),
+        "patients_list": lambda i: client.get(
+            "/api/v1/patients/", params={"limit": 50, "skip": picks[i] % 1000}
+        ),
+        "patients_get": lambda i: client.get(f"/api/v1/patients/{picks[i]}"),
+        "patients_create": create,
+        "patients_update": update,
+        "patients_delete": lambda i: client.delete(f"/api/v1/patients/{created[i]}"),
+        "dashboard_stats": lambda i: client.get("/api/v1/dashboard/stats"),
+        "chat": lambda i: client.post("/api/v1/chatbot/chat", json={"message": messages[i]}),
+    }
+
+    results = {}
+    for name in args.scenarios:
+        count = args.requests
+        if name == "login":
+            # bcrypt bound; a full run would dominate the suite's wall time
+            count = max(1, args.requests // 10)
+        if name == "patients_delete":
+            count = len(created)
+        if name in ("patients_update", "patients_delete") and not created:
+            print(f"{name}: skipped, run patients_create first")
+            continue
+        request = requests[name]
+        if name not in ("patients_create", "patients_delete"):
+            # Warm caches and connection pools before measuring
+            await asyncio.gather(*(request(i) for i in range(min(args.warmup, count))))
+        results[name] = await run_scenario(request, count, args.concurrency)
+        print(f"{name}: {results[name]['throughput']:.1f} req/s")
+    return results
+
+async def run_with_client(args) -> Dict[str, Dict[str, Any]]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    if not args.in_process:
+        async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+            return await run(client, args)
+
+    from app.main import app
+    # ASGITransport sends no lifespan events, so run the startup and
+    # shutdown here and wait until the pool is warm, as /health/ready would
+    async with app.router.lifespan_context(app):
+        await app.state.db_connect_task
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://benchmark",
+            limits=limits,
+            timeout=60,
+        ) as client:
+            return await run(client, args)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", default="http://localhost:8000")
+    target.add_argument("--in-process", action="store_true", help="Run the app in this process")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", help="Free-form note stored in the report, e.g. the data size")
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--baseline", help="Compare against this JSON report")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Allowed slowdown as a fraction (0.15 = 15%%)")
+    args = parser.parse_args()
+
+    scenarios = asyncio.run(run_with_client(args))
+    result = {
+        "environment": report.environment(),
+        "settings": {
+            "target": "in-process" if args.in_process else args.base_url,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "label": args.label,
+        },
+        "scenarios": scenarios,
+    }
+    if args.output:
+        report.save(result, args.output)
+
+    baseline = report.load(args.baseline) if args.baseline else None
+    report.print_table(result, baseline)
+    if baseline is not None:
+        regressions = report.compare(baseline, result, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark reports: latency summaries, JSON storage and baseline comparison.
+
+    python -m benchmarks.report baseline.json current.json [--threshold 0.15]
+
+exits 1 if `current` regressed against `baseline`.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round((len(ordered) - 1) * fraction)))]
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    """
+    Scenario summary from per-request latencies (seconds) and wall time.
+    """
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "requests": count,
+        "errors": errors,
+        "throughput": count / elapsed if elapsed else 0.0,
+        "meanMs": sum(ordered) / count * 1000 if count else 0.0,
+        "p50Ms": percentile(ordered, 0.50) * 1000,
+        "p99Ms": percentile(ordered, 0.99) * 1000,
+        "maxMs": ordered[-1] * 1000 if count else 0.0,
+    }
+
+def environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+
+def save(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Regressions of `current` against `baseline`: throughput down, or p50/p99
+    up, by more than `threshold` (a fraction), and any failed requests.
+    Scenarios missing from either report are not compared.
+    """
+    regressions = []
+    for name, now in sorted(current["scenarios"].items()):
+        if now["errors"]:
+            regressions.append(f"{name}: {now['errors']} failed requests")
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        if before["throughput"] and now["throughput"] < before["throughput"] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {before['throughput']:.1f} -> {now['throughput']:.1f} req/s"
+            )
+        for key in ("p50Ms", "p99Ms"):
+            if before[key] and now[key] > before[key] * (1 + threshold):
+                regressions.append(f"{name}: {key} {before[key]:.2f} -> {now[key]:.2f}")
+    return regressions
+
+def print_table(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    print(f"{'scenario':<18} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>6}  vs baseline")
+    for name, row in sorted(report["scenarios"].items()):
+        delta = ""
+        before = (baseline or {}).get("scenarios", {}).get(name)
+        if before and before["throughput"]:
+            delta = f"{(row['throughput'] / before['throughput'] - 1) * 100:+.1f}% req/s"
+        print(
+            f"{name:<18} {row['throughput']:>9.1f} {row['p50Ms']:>8.2f} "
+            f"{row['p99Ms']:>8.2f} {row['errors']:>6}  {delta}"
+        )
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.report")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args()
+
+    baseline, current = load(args.baseline), load(args.current)
+    print_table(current, baseline)
+    regressions = compare(baseline, current, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Synthetic data for benchmarks: seeds deterministic patients (same --seed,
+same rows) and the benchmark login into the default clinic of the database
+named by DATABASE_URL. On Postgres run the migrations first; SQLite cannot
+run them, so there the tables and the default clinic are created from the
+models.
+
+    python -m benchmarks.seed --size 100k [--seed 0]
+
+Re-running is safe: patients whose email already exists are skipped.
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List
+from app.core.config import settings
+from app.crud import clinic as clinic_crud
+from app.crud import patient as patient_crud
+from app.crud import user as user_crud
+from app.db.base_class import Base
+from app.db.session import SessionLocal, get_engine
+from app.models.clinic import Clinic
+from app.schemas.user import UserCreate
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+BENCH_EMAIL = "bench@example.com"
+BENCH_PASSWORD = "bench-password"
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Carlos", "Maria", "Wei", "Fatima", "Ahmed", "Yuki",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Nguyen", "Chen", "Khan",
+]
+HISTORY = [
+    "No known allergies.",
+    "Allergic to penicillin.",
+    "Periodontal maintenance every three months.",
+    "Root canal on tooth 19, crown placed.",
+    "Sensitive to cold; uses fluoride toothpaste.",
+    "Orthodontic treatment completed.",
+]
+
+def generate_patients(count: int, seed: int = 0) -> Iterator[Dict]:
+    rng = random.Random(seed)
+    for i in range(count):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        yield {
+            "first_name": first,
+            "last_name": last,
+            "date_of_birth": date(1940, 1, 1) + timedelta(days=rng.randrange(30000)),
+            "email": f"{first.lower()}.{last.lower()}.{seed}.{i}@bench.example.com",
+            "phone": f"+1 555 {rng.randrange(1000):03d} {rng.randrange(10000):04d}",
+            "address": f"{rng.randrange(1, 9999)} {rng.choice(LAST_NAMES)} St",
+            "medical_history": " ".join(rng.sample(HISTORY, rng.randint(1, 4))),
+            "last_visit": datetime(2024, 1, 1) + timedelta(minutes=rng.randrange(900_000)),
+        }
+
+async def ensure_sqlite_schema() -> None:
+    # The crud modules imported above load every model onto Base.metadata
+    engine = get_engine()
+    if engine.dialect.name != "sqlite":
+        return
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with SessionLocal() as db:
+        if await clinic_crud.get_clinic(db, settings.DEFAULT_TENANT_ID) is None:
+            db.add(Clinic(id=settings.DEFAULT_TENANT_ID, name="Default clinic", slug="default"))
+            await db.commit()
+
+async def ensure_bench_user() -> None:
+    async with SessionLocal() as db:
+        if await user_crud.get_user_by_email(db, BENCH_EMAIL) is None:
+            await user_crud.create_user(db, UserCreate(
+                email=BENCH_EMAIL,
+                name="Benchmark",
+                password=BENCH_PASSWORD,
+                confirm_password=BENCH_PASSWORD,
+            ))
+
+async def seed_patients(count: int, seed: int) -> int:
+    inserted = 0
+    batch: List[Dict] = []
+    async with SessionLocal() as db:
+        for row in generate_patients(count, seed):
+            batch.append(row)
+            if len(batch) >= settings.IMPORT_BATCH_SIZE:
+                inserted += (await patient_crud.bulk_insert_patients(
+                    db, settings.DEFAULT_TENANT_ID, batch
+                ))[0]
+                batch = []
+        if batch:
+            inserted += (await patient_crud.bulk_insert_patients(
+                db, settings.DEFAULT_TENANT_ID, batch
+            ))[0]
+    return inserted
+
+async def run(count: int, seed: int) -> None:
+    started = time.perf_counter()
+    await ensure_sqlite_schema()
+    await ensure_bench_user()
+    inserted = await seed_patients(count, seed)
+    elapsed = time.perf_counter() - started
+    print(f"Inserted {inserted} of {count} patients in {elapsed:.1f}s")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.seed")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--size", choices=sorted(SIZES))
+    group.add_argument("--patients", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(run(args.patients or SIZES[args.size], args.seed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: time to serialize a page of patients the old way (ORM objects
+validated through List[Patient], then encoded with the stdlib json module,
+as FastAPI's response_model path does) against the new path (Row tuples
+encoded directly with orjson).
+
+    python -m benchmarks.serialization [--repeat 50]
+"""
+import argparse
+import json
+import time
+from datetime import date, datetime
+from typing import List
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.serialization import rows_to_dicts
+from app.db.base_class import Base
+from app.models.clinic import Clinic
+from app.models.patient import Patient as PatientModel
+from app.schemas.patient import Patient
+
+def seed(session: Session, count: int) -> None:
+    now = datetime.utcnow()
+    session.add(Clinic(id=settings.DEFAULT_TENANT_ID, name="Benchmark", slug="benchmark"))
+    session.add_all(
+        PatientModel(
+            tenant_id=settings.DEFAULT_TENANT_ID,
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+            date_of_birth=date(1980, 1, 1),
+            email=f"patient{i}@example.com",
+            phone="+1 555 0100",
+            address="123 Main St",
+            medical_history="No known allergies. " * 20,
+            last_visit=now,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    )
+    session.commit()
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Clinic.__table__, PatientModel.__table__])
+    adapter = TypeAdapter(List[Patient])
+    # As the list endpoint selects them: tenant_id is never returned
+    columns = [column for column in PatientModel.__table__.columns if column.name != "tenant_id"]
+
+    with Session(engine) as session:
+        seed(session, 1000)
+        print(f"{'rows':>5} {'validate+json ms':>17} {'rows+orjson ms':>15} {'speedup':>8}")
+        for size in (100, 1000):
+            objects = session.scalars(select(PatientModel).limit(size)).all()
+            rows = session.execute(select(*columns).limit(size)).all()
+
+            def old_path():
+                validated = adapter.validate_python(objects, from_attributes=True)
+                json.dumps(adapter.dump_python(validated, mode="json")).encode()
+
+            def new_path():
+                orjson.dumps(rows_to_dicts(rows))
+
+            old = best_of(old_path, args.repeat)
+            new = best_of(new_path, args.repeat)
+            print(f"{size:>5} {old:>17.3f} {new:>15.3f} {old / new:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Production server: gunicorn managing uvicorn workers.
+
+    gunicorn app.main:app -c gunicorn.conf.py
+
+Workers default to one per core, capped by DB_CONNECTION_BUDGET; override
+with WEB_CONCURRENCY. The app is imported in each worker after the fork
+(no preload), and the engine, connection pool and password-hashing
+processes are created lazily inside the worker, so no socket or thread is
+ever shared between processes. On SIGTERM workers stop accepting
+connections and get GRACEFUL_TIMEOUT seconds to finish in-flight requests.
+"""
+import multiprocessing
+import os
+import tempfile
+from app.core.capacity import DEFAULT_CONNECTION_BUDGET, plan_workers
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(
+    os.getenv("WEB_CONCURRENCY")
+    or plan_workers(
+        multiprocessing.cpu_count(),
+        int(os.getenv("DB_CONNECTION_BUDGET", str(DEFAULT_CONNECTION_BUDGET))),
+    )
+)
+preload_app = False
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+keepalive = 5
+accesslog = "-"
+
+# Workers read these from the environment: they split the connection budget
+# and the cores for password hashing by the number of workers
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+# Aggregate Prometheus metrics across workers
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", tempfile.mkdtemp(prefix="prometheus-"))
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)